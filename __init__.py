@@ -20,14 +20,26 @@
 import bpy
 import blf
 import mathutils
+import mathutils.bvhtree
 import os
 import glob
+import time
+import json
+import numpy
+import hashlib
+import tempfile
+import shutil
+import subprocess
+import struct
 import gpu
 from gpu_extras.batch import batch_for_shader
-from math import pi
+from math import pi, floor, ceil, acos
+from collections import deque
+from functools import lru_cache
 from bpy_extras.io_utils import ImportHelper, ExportHelper
 from bpy_extras.image_utils import load_image
 import bpy.utils.previews
+from bpy.app.handlers import persistent
 
 bl_info = {
     "name": "VSE Quick Titling",
@@ -468,6 +480,30 @@ animations = [
     }
 ]
 
+render_profiles = {
+    'DRAFT': {
+        'taa_render_samples': 4,
+        'taa_samples': 2,
+        'use_raytracing': False,
+        'shadow_ray_count': 1,
+        'shadow_step_count': 1
+    },
+    'PREVIEW': {
+        'taa_render_samples': 12,
+        'taa_samples': 8,
+        'use_raytracing': False,
+        'shadow_ray_count': 2,
+        'shadow_step_count': 2
+    },
+    'FINAL': {
+        'taa_render_samples': 32,
+        'taa_samples': 16,
+        'use_raytracing': True,
+        'shadow_ray_count': 4,
+        'shadow_step_count': 4
+    }
+}
+
 quicktitle_previews = bpy.utils.previews.new()
 
 current_icon_id = 0
@@ -476,8 +512,122 @@ overlays = None
 
 overlay_info = ''
 
+#set while a modal transform commits its values so the title is only updated once
+suspend_autoupdate = False
+
+overlay_shaders = {}
+
+overlay_batch = {'key': None, 'batch': None}
+
 keymap = None
 
+glyph_meshes = {}
+
+glyph_advances = {}
+
+glyph_line_heights = {}
+
+pick_cache = {}
+
+#the title scene state the depsgraph was last updated for when picking
+pick_depsgraph = {'key': None}
+
+pick_cycle = {'key': None, 'mouse': (0, 0), 'objects': [], 'index': 0}
+
+title_revision = 0
+
+#names of the title scenes that have been set to the viewed frame since the frame last changed
+title_frame_synced = set()
+
+bounds_grid = {'key': None, 'cells': {}}
+
+bounds_grid_size = 64
+
+hover_object = {'scene': '', 'index': -1}
+
+animated_bounds = {}
+
+#fonts found in the font folders setting, 'fonts' is lowercase family/style/full name: file path
+font_registry = {'directories': None, 'fonts': {}, 'names': []}
+font_extensions = ['.ttf', '.otf', '.ttc']
+
+#data made by title scenes, in the order it can be removed, materials use node groups and images
+thumbnail_datablock_types = ['meshes', 'curves', 'lights', 'cameras', 'actions', 'materials', 'node_groups', 'textures', 'images']
+
+#Preset settings that are not copied between presets, these refer to the generated scene or the current selection
+snapshot_exclude = ('rna_type', 'selected_object', 'selected_animation', 'internal_name', 'internal_material', 'lampcenter_internal_name', 'shadowlamp_internal_name', 'shadowlamp_inverse_internal_name', 'bbleft', 'bbright', 'bbtop', 'bbbottom', 'missing_glyphs')
+#Text, enum and switch settings only used by some object types, these are only copied for objects of the types that use them.
+#Number settings are copied for a whole list of objects at once in a packed block, so they are copied for every type.
+object_type_fields = {
+    'TEXT': ('text', 'font', 'word_wrap', 'align', 'glyph_mode', 'glyph_reverse', 'outline'),
+    'BOX': ('outline',),
+    'CIRCLE': ('outline',),
+    'IMAGE': ('window_mapping', 'texture', 'alpha_texture', 'loop')}
+
+#characters each font file can display, font file path: (file size, modified time, set of character codes)
+font_coverage_cache = {}
+
+
+class UpdateProfiler:
+    #Records the time taken by each stage of title updates when profiling is enabled in the debug panel.
+    #The last updates are kept in a ring buffer, each one stores the total time per stage and per object.
+    #Writes to blender data that cause re-evaluation are also counted, along with the datablocks added by the update.
+    datablock_types = ['objects', 'meshes', 'curves', 'materials']
+
+    def __init__(self, size=50):
+        self.records = deque(maxlen=size)
+        self.current = None
+        self.update_start = 0
+        self.stage_start = 0
+        self.datablocks = {}
+
+    def begin(self, title):
+        #starts recording an update, an unfinished update from a previous error is discarded
+        self.current = None
+        if not bpy.context.scene.quicktitler.debug_profiling:
+            return
+        self.current = {'title': title, 'time': time.strftime('%H:%M:%S'), 'total': 0.0, 'stages': {}, 'objects': {}, 'counts': {}}
+        self.datablocks = {datablock_type: len(getattr(bpy.data, datablock_type)) for datablock_type in self.datablock_types}
+        self.update_start = time.perf_counter()
+        self.stage_start = self.update_start
+
+    def mark(self, stage, object_name=None):
+        #adds the time since the last mark to a stage, and to the object if one is given
+        if self.current is None:
+            return
+        now = time.perf_counter()
+        elapsed = now - self.stage_start
+        self.stage_start = now
+        stages = self.current['stages']
+        stages[stage] = stages.get(stage, 0.0) + elapsed
+        if object_name is not None:
+            object_stages = self.current['objects'].setdefault(object_name, {})
+            object_stages[stage] = object_stages.get(stage, 0.0) + elapsed
+
+    def count(self, counter, amount=1):
+        #adds to one of the write counters of the current update
+        if self.current is None:
+            return
+        counts = self.current['counts']
+        counts[counter] = counts.get(counter, 0) + amount
+
+    def end(self):
+        if self.current is None:
+            return
+        self.current['total'] = time.perf_counter() - self.update_start
+        for datablock_type, length in self.datablocks.items():
+            added = len(getattr(bpy.data, datablock_type)) - length
+            if added:
+                self.current['counts']['new '+datablock_type] = added
+        self.records.append(self.current)
+        self.current = None
+
+    def clear(self):
+        self.records.clear()
+
+
+update_profiler = UpdateProfiler()
+
 
 class ShadersHelper:
     material = None
@@ -501,10 +651,12 @@ class ShadersHelper:
         for link in reversed(links):
             if link.from_node == connect_from and link.to_node == connect_to:
                 links.remove(link)
+                update_profiler.count('links removed')
 
     def connect_socket(self, from_socket, to_socket):
         links = self.material.node_tree.links
         links.new(from_socket, to_socket)
+        update_profiler.count('links created')
 
     def ensure_socket_connected(self, from_socket, to_socket):
         if not self.node_is_connected(from_socket, to_socket):
@@ -515,6 +667,12 @@ class ShadersHelper:
 
     def set_node_input(self, node, input_name, value):
         node.inputs[input_name].default_value = value
+        update_profiler.count('node values')
+
+    def set_node_color(self, node, input_name, color):
+        #sets the rgb of a color input, leaving the alpha alone
+        node.inputs[input_name].default_value[:3] = color
+        update_profiler.count('node values')
 
     def find_node_type(self, node_type):
         for check_node in self.material.node_tree.nodes:
@@ -596,12 +754,12 @@ class ShadersHelper:
             if self.shader.type != 'EMISSION':
                 self.material.node_tree.nodes.remove(self.shader)
                 self.shader = self.material.node_tree.nodes.new('ShaderNodeEmission')
-                self.material.node_tree.links.new(self.shader.outputs[0], self.mix_shader.inputs[2])
+                self.connect_socket(self.shader.outputs[0], self.mix_shader.inputs[2])
         else:
             if self.shader.type != 'BSDF_PRINCIPLED':
                 self.material.node_tree.nodes.remove(self.shader)
                 self.shader = self.material.node_tree.nodes.new('ShaderNodeBsdfPrincipled')
-                self.material.node_tree.links.new(self.shader.outputs[0], self.mix_shader.inputs[2])
+                self.connect_socket(self.shader.outputs[0], self.mix_shader.inputs[2])
 
     def setup_material(self):
         #re/creates a material
@@ -622,7 +780,7 @@ class ShadersHelper:
             self.image_node = self.add_node('ShaderNodeTexImage')
             self.alpha_image_node = self.add_node('ShaderNodeTexImage')
             self.alpha_mix_node = self.add_node('ShaderNodeMixRGB')
-            self.alpha_mix_node.inputs[0].default_value = 0
+            self.set_node_input(self.alpha_mix_node, 0, 0)
             self.texture_map_node = self.add_node('ShaderNodeTexCoord')
             self.connect_socket(self.alpha_mix_node.outputs[0], self.transparency_factor.inputs[0])
             #self.connect_socket(self.image_node.outputs[0], self.shader.inputs[0])
@@ -643,14 +801,15 @@ class ShadersHelper:
 
         #set up basic values on nodes
         self.transparent_shader.inputs[0].default_value[3] = 0
-        self.transparency_factor.inputs[0].default_value = 1
-        self.transparency_factor.inputs[1].default_value = 1
+        update_profiler.count('node values')
+        self.set_node_input(self.transparency_factor, 0, 1)
+        self.set_node_input(self.transparency_factor, 1, 1)
         self.transparency_factor.operation = 'MULTIPLY'
         self.transparency_factor.use_clamp = True
         self.light_path_factor.operation = 'MULTIPLY'
         self.light_path_factor.use_clamp = True
-        self.light_path_factor.inputs[1].default_value = 1
-        self.mix_shader.inputs[0].default_value = 1
+        self.set_node_input(self.light_path_factor, 1, 1)
+        self.set_node_input(self.mix_shader, 0, 1)
 
     def load_from_material(self, material, use_shadeless, mat_type):
         self.use_shadeless = use_shadeless
@@ -684,12 +843,12 @@ class ShadersHelper:
             self.set_node_input(self.shader, 'Specular IOR Level', preset.specular_intensity)
             self.set_node_input(self.shader, 'Metallic', preset.metallic)
             self.set_node_input(self.shader, 'Transmission Weight', preset.transmission)
-            self.shader.inputs['Base Color'].default_value[:3] = preset.diffuse_color
+            self.set_node_color(self.shader, 'Base Color', preset.diffuse_color)
             self.set_node_input(self.shader, 'Roughness', preset.roughness)
             self.set_node_input(self.shader, 'IOR', preset.index_of_refraction)
 
         else:
-            self.shader.inputs['Color'].default_value[:3] = preset.diffuse_color
+            self.set_node_color(self.shader, 'Color', preset.diffuse_color)
             self.set_node_input(self.shader, 'Strength', 1)
 
     def update_shadowcasting(self, cast_shadows):
@@ -701,6 +860,18 @@ class ShadersHelper:
         else:
             self.disconnect_node(light_path_node, self.light_path_factor)
 
+    def update_instance_alpha(self, use_instance_alpha):
+        #multiplies the transparency by an object property, so every object sharing this material can fade on its own
+        attribute_node = self.find_node_type('ATTRIBUTE')
+        if use_instance_alpha:
+            if not attribute_node:
+                attribute_node = self.add_node('ShaderNodeAttribute')
+                attribute_node.attribute_type = 'OBJECT'
+                attribute_node.attribute_name = 'quicktitle_alpha'
+            self.ensure_socket_connected(attribute_node.outputs['Fac'], self.transparency_factor.inputs[0])
+        else:
+            self.disconnect_node(attribute_node, self.transparency_factor)
+
     def update_image(self, preset):
         if preset.texture:
             #image texture is set
@@ -738,7 +909,7 @@ class ShadersHelper:
             self.disconnect_node(self.image_node, self.shader)
             self.image_node.image = None
 
-        self.alpha_mix_node.inputs[0].default_value = 0
+        self.set_node_input(self.alpha_mix_node, 0, 0)
 
         if preset.alpha_texture:
             #alpha texture is set
@@ -754,7 +925,7 @@ class ShadersHelper:
                 image = find_load_image(path)
                 image.update()
                 self.alpha_image_node.image = image
-                self.alpha_mix_node.inputs[0].default_value = 1
+                self.set_node_input(self.alpha_mix_node, 0, 1)
                 if video:
                     #set video defaults
                     preset.frame_length = image.frame_duration
@@ -781,6 +952,19 @@ def get_action_fcurves(action):
     return action.layers[0].strips[0].channelbag(action.slots[0]).fcurves
 
 
+def ensure_action_fcurves(action, id_type='OBJECT'):
+    #like get_action_fcurves, but creates the slot, layer and strip if they are missing.
+    #Used for actions that are only played through NLA strips, so fcurve_ensure_for_datablock can't be used since the action is never assigned.
+    if not action.slots:
+        action.slots.new(id_type, action.name)
+    if not action.layers:
+        action.layers.new('Layer')
+    layer = action.layers[0]
+    if not layer.strips:
+        layer.strips.new(type='KEYFRAME')
+    return layer.strips[0].channelbag(action.slots[0], ensure=True).fcurves
+
+
 def find_load_image(path, load=True):
     abs_path = bpy.path.abspath(path)
     for image in bpy.data.images:
@@ -792,58 +976,180 @@ def find_load_image(path, load=True):
         return None
 
 
-def object_at_location(scene, x, y):
+def pick_geometry_key(title_object):
+    #returns a value that changes whenever the shape of an object changes, used to know when a pick tree needs to be rebuilt
+    data = title_object.data
+    if title_object.type == 'FONT':
+        font = data.font.name if data.font else ''
+        box = data.text_boxes[0]
+        return (data.name, data.body, font, data.size, data.extrude, data.bevel_depth, data.bevel_resolution, data.resolution_u, data.shear, data.align_x, data.align_y, data.offset_x, data.offset_y, data.space_line, box.x, box.y, box.width, box.height)
+    elif title_object.type == 'CURVE':
+        points = tuple(tuple(point.co) for spline in data.splines for point in spline.points)
+        return (data.name, points, data.extrude, data.bevel_depth, data.bevel_resolution, data.resolution_u, data.offset, data.fill_mode, data.dimensions)
+    else:
+        coordinates = [0.0] * (len(data.vertices) * 3)
+        data.vertices.foreach_get('co', coordinates)
+        return (data.name, len(data.polygons), tuple(coordinates))
+
+
+def get_pick_tree(title_object, depsgraph):
+    #returns a BVH tree of the object in local space, only rebuilding it if the geometry has changed since the last pick
+    key = pick_geometry_key(title_object)
+    cached = pick_cache.get(title_object.name)
+    if cached and cached[0] == key:
+        return cached[1]
+    evaluated = title_object.evaluated_get(depsgraph)
+    try:
+        mesh = evaluated.to_mesh()
+    except:
+        return None
+    if mesh is None:
+        return None
+    mesh.calc_loop_triangles()
+    vertices = [vertex.co.copy() for vertex in mesh.vertices]
+    triangles = [tuple(triangle.vertices) for triangle in mesh.loop_triangles]
+    evaluated.to_mesh_clear()
+    tree = mathutils.bvhtree.BVHTree.FromPolygons(vertices, triangles) if triangles else None
+    pick_cache[title_object.name] = (key, tree)
+    return tree
+
+
+def get_bounds_grid(scene, quicktitle, frame):
+    #Returns a dictionary of grid cells, each containing the index of every object whose bounds touch that cell.
+    #The grid is only rebuilt when the title is updated or the frame changes, so looking up the objects under the mouse does not need to check every object.
+    key = (scene.name, title_revision, len(quicktitle.objects), frame)
+    if bounds_grid['key'] != key:
+        cells = {}
+        for object_layer, object_preset in enumerate(quicktitle.objects):
+            bounds = object_bounds(scene, quicktitle, object_layer, frame)
+            left = int(bounds[0] // bounds_grid_size)
+            right = int(bounds[2] // bounds_grid_size)
+            bottom = int(bounds[1] // bounds_grid_size)
+            top = int(bounds[3] // bounds_grid_size)
+            for cell_x in range(left, right + 1):
+                for cell_y in range(bottom, top + 1):
+                    cells.setdefault((cell_x, cell_y), []).append(object_layer)
+        bounds_grid['key'] = key
+        bounds_grid['cells'] = cells
+    return bounds_grid['cells']
+
+
+def objects_in_bounds(scene, quicktitle, x, y, frame):
+    #Returns the title objects whose screen bounds at the given title frame contain the given pixel location, front-most first
+    candidates = []
+    z_scale = quicktitle.z_scale / 10.0
+    cell = (int(x // bounds_grid_size), int(y // bounds_grid_size))
+    for object_layer in get_bounds_grid(scene, quicktitle, frame).get(cell, []):
+        object_preset = quicktitle.objects[object_layer]
+        if not object_preset.visible or object_preset.internal_name not in scene.objects:
+            continue
+        left, bottom, right, top = object_bounds(scene, quicktitle, object_layer, frame)
+        if left <= x <= right and bottom <= y <= top:
+            depth = object_preset.z - (object_layer * z_scale)
+            candidates.append((-depth, object_layer, scene.objects[object_preset.internal_name]))
+    candidates.sort(key=lambda candidate: candidate[:2])
+    return [candidate[2] for candidate in candidates]
+
+
+def preset_index(quicktitle, title_object):
+    #returns the index of the object preset that created the given object, or -1
+    for index, object_preset in enumerate(quicktitle.objects):
+        if object_preset.internal_name == title_object.name:
+            return index
+    return -1
+
+
+def object_at_location(scene, x, y, objects=None):
     #Casts a ray from the camera to the given coordinates and returns the first object in that direction, or None
-    oldscene = bpy.context.window.scene
-    bpy.context.window.scene = scene  #Since blender doesnt want to cast the ray properly while in another scene... bah.
-    camera = scene.camera
-    #since blender doesnt detect curve objects... go through and make low-poly copies of all curves, then delete them. bah.
-    title_copies = []
-    for title_object in scene.objects:
-        if title_object.type in ['CURVE', 'FONT']:
-            scale = title_object.scale
-            location = title_object.location
-            rotation = title_object.rotation_euler
-            old_resolution_u = title_object.data.resolution_u
-            old_bevel_resolution = title_object.data.bevel_resolution
-            title_object.data.resolution_u = 2
-            title_object.data.bevel_resolution = 0
-
-            #mesh = title_object.to_mesh(preserve_all_data_layers=True, depsgraph=bpy.context.view_layer.depsgraph)
-            mesh = bpy.data.meshes.new_from_object(title_object, preserve_all_data_layers=True, depsgraph=bpy.context.view_layer.depsgraph)
-            ob = bpy.data.objects.new(mesh.name+' Raycast', mesh)
-            scene.collection.objects.link(ob)
-            ob.scale = scale
-            ob.location = location
-            ob.rotation_euler = rotation
-            title_copies.append([mesh, ob, title_object])
-
-            title_object.data.resolution_u = old_resolution_u
-            title_object.data.bevel_resolution = old_bevel_resolution
-    direction = (mathutils.Vector((x, y, 0)) - camera.location).normalized()
-    bpy.context.view_layer.depsgraph.update()
-    data = scene.ray_cast(scene.view_layers[0].depsgraph, camera.location, direction)
-    if data[0]:
-        match_object = data[4]
+    hits = objects_at_location(scene, x, y, objects=objects)
+    if hits:
+        return hits[0]
+    return None
+
+
+def pick_depsgraph_get(scene):
+    #Returns the depsgraph of a title scene, building it if the scene has never been evaluated, or None if that is not possible.
+    #The title scene is not the window scene while picking, so it may not have a depsgraph yet.
+    depsgraph = scene.view_layers[0].depsgraph
+    if depsgraph is not None:
+        return depsgraph
+    pick_depsgraph['key'] = None
+    window = bpy.context.window
+    if window:
+        oldscene = window.scene
+        window.scene = scene
+        try:
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+        finally:
+            window.scene = oldscene
     else:
-        match_object = None
-    for copy in title_copies:
-        mesh, ob, title_object = copy
-        if data[0]:
-            if data[4] == ob:
-                match_object = title_object
-        scene.collection.objects.unlink(ob)
-        bpy.data.objects.remove(ob)
-        bpy.data.meshes.remove(mesh)
-    bpy.context.view_layer.depsgraph.update()
-    bpy.context.window.scene = oldscene
-    return match_object
+        try:
+            with bpy.context.temp_override(scene=scene, view_layer=scene.view_layers[0]):
+                depsgraph = bpy.context.evaluated_depsgraph_get()
+        except:
+            return None
+    return scene.view_layers[0].depsgraph or depsgraph
+
+
+def objects_at_location(scene, x, y, objects=None):
+    #Casts a ray from the camera to the given coordinates and returns every object in that direction, nearest first
+    #Each object keeps a cached BVH tree of its geometry, so picking does not need to convert any curves unless they have changed.
+    #If a list of objects is given, only these will be tested.
+    camera = scene.camera
+    depsgraph = pick_depsgraph_get(scene)
+    if depsgraph is None:
+        return []
+    #the depsgraph only needs updating if the title or frame has changed since the last pick
+    depsgraph_key = (scene.name, title_revision, scene.frame_current)
+    if pick_depsgraph['key'] != depsgraph_key:
+        depsgraph.update()
+        pick_depsgraph['key'] = depsgraph_key
+    origin = camera.location
+    direction = (mathutils.Vector((x, y, 0)) - origin).normalized()
+
+    #forget about objects that dont exist anymore
+    for name in list(pick_cache.keys()):
+        if name not in bpy.data.objects:
+            del pick_cache[name]
+
+    hits = []
+    if objects is None:
+        objects = scene.objects
+    for title_object in objects:
+        if title_object.type not in ['MESH', 'CURVE', 'FONT']:
+            continue
+        if 'quicktitle_glyph_index' in title_object:
+            #glyphs are selected as the text object they belong to
+            continue
+        if title_object.hide_viewport or title_object.hide_get(view_layer=scene.view_layers[0]):
+            continue
+        tree = get_pick_tree(title_object, depsgraph)
+        if tree is None:
+            continue
+        matrix = title_object.evaluated_get(depsgraph).matrix_world
+        matrix_inverse = matrix.inverted_safe()
+        local_origin = matrix_inverse @ origin
+        local_direction = (matrix_inverse.to_3x3() @ direction).normalized()
+        hit = tree.ray_cast(local_origin, local_direction)
+        if hit[0] is None:
+            continue
+        distance = ((matrix @ hit[0]) - origin).length
+        hits.append((distance, title_object))
+    hits.sort(key=lambda hit: hit[0])
+    return [hit[1] for hit in hits]
+
+
+def get_overlay_shader(shader_type='UNIFORM_COLOR'):
+    #returns a builtin shader, only fetching it once
+    if shader_type not in overlay_shaders:
+        overlay_shaders[shader_type] = gpu.shader.from_builtin(shader_type)
+    return overlay_shaders[shader_type]
 
 
 def draw_line(sx, sy, ex, ey, width, color=(1.0, 1.0, 1.0, 1.0)):
     del width
     coords = [(sx, sy), (ex, ey)]
-    shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+    shader = get_overlay_shader()
     batch = batch_for_shader(shader, 'LINES', {'pos': coords})
     shader.bind()
     shader.uniform_float('color', color)
@@ -858,13 +1164,52 @@ def draw_text(x, y, size, text, color=(1.0, 1.0, 1.0, 1.0)):
     blf.draw(font_id, text)
 
 
-def draw_box(left, bottom, right, top, color=(1.0, 1.0, 0.0, 1.0)):
-    coords = [(left, bottom), (left, top), (left, top), (right, top), (right, top), (right, bottom), (right, bottom), (left, bottom)]
-    shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-    batch = batch_for_shader(shader, 'LINES', {'pos': coords})
-    shader.bind()
-    shader.uniform_float('color', color)
-    batch.draw(shader)
+def draw_boxes(boxes, transform):
+    #Draws a list of (left, bottom, right, top, color) boxes given in view coordinates, all in one batch.
+    #The batch is stored and only rebuilt when the boxes or the view transform changes.
+    shader = get_overlay_shader('FLAT_COLOR')
+    key = (tuple(boxes), transform)
+    if overlay_batch['key'] != key:
+        offset_x, offset_y, scale_x, scale_y = transform
+        coords = []
+        colors = []
+        for box in boxes:
+            left, bottom, right, top, color = box
+            left = left * scale_x + offset_x
+            right = right * scale_x + offset_x
+            bottom = bottom * scale_y + offset_y
+            top = top * scale_y + offset_y
+            coords.extend([(left, bottom), (left, top), (left, top), (right, top), (right, top), (right, bottom), (right, bottom), (left, bottom)])
+            colors.extend([color] * 8)
+        overlay_batch['key'] = key
+        overlay_batch['batch'] = batch_for_shader(shader, 'LINES', {'pos': coords, 'color': colors}) if coords else None
+    if overlay_batch['batch']:
+        shader.bind()
+        overlay_batch['batch'].draw(shader)
+
+
+@persistent
+def quicktitle_frame_change(scene, depsgraph=None):
+    #Only records that the title scenes may be on the wrong frame, each title scene is updated by sync_title_frame when an operator needs it
+    if is_title_scene(scene):
+        title_frame_synced.discard(scene.name)
+    else:
+        title_frame_synced.clear()
+
+
+def get_title_frame(sequence):
+    #returns the frame of the title scene that is displayed at the current frame in the vse
+    return int(round(bpy.context.scene.frame_current - sequence.frame_start))
+
+
+def sync_title_frame(sequence):
+    #Ensures that the title scene's frame is set to the viewed frame in the vse, needed for clicking and editing title objects
+    scene = sequence.scene
+    new_frame = get_title_frame(sequence)
+    if scene.name not in title_frame_synced or scene.frame_current != new_frame:
+        #the sequencer may change the title scene's frame while rendering it without evaluating it, so set the frame even if it appears to be correct
+        scene.frame_set(new_frame)
+        title_frame_synced.add(scene.name)
 
 
 def add_overlay(self=None, context=None):
@@ -897,20 +1242,27 @@ def quicktitling_overlay():
                 except:
                     title_object = None
                 if title_object:
-                    #Ensures that the title scene's frame is set to the viewed frame in the vse, needed for clicking title objects.  Needs to be put here to give blender a chance to update the scene before a click.
-                    new_frame = bpy.context.scene.frame_current - quicktitle_sequence.frame_start
-                    if scene.frame_current != new_frame:
-                        scene.frame_set(int(round(new_frame)))
                     for region in area.regions:
                         if region.type == 'PREVIEW':
                             break
                     view = region.view2d
-                    min_x = title_object_preset.bbleft
-                    max_x = title_object_preset.bbright
-                    min_y = title_object_preset.bbbottom
-                    max_y = title_object_preset.bbtop
-                    left, bottom = view.view_to_region(min_x, min_y, clip=False)
-                    right, top = view.view_to_region(max_x, max_y, clip=False)
+                    #view to region is a simple scale and offset, so only two points need to be converted
+                    offset_x, offset_y = view.view_to_region(0, 0, clip=False)
+                    scale_x, scale_y = view.view_to_region(1, 1, clip=False)
+                    transform = (offset_x, offset_y, scale_x - offset_x, scale_y - offset_y)
+
+                    boxes = []
+                    title_frame = get_title_frame(quicktitle_sequence)
+                    if bpy.context.scene.quicktitler.overlay_show_all:
+                        hover_index = hover_object['index'] if hover_object['scene'] == scene.name else -1
+                        for object_layer, object_preset in enumerate(preset.objects):
+                            if object_preset.visible and object_layer != preset.selected_object:
+                                if object_layer == hover_index:
+                                    color = (.4, .8, 1, 1)
+                                else:
+                                    color = (.6, .6, .6, 1)
+                                boxes.append(tuple(object_bounds(scene, preset, object_layer, title_frame)) + (color, ))
+                    min_x, min_y, max_x, max_y = object_bounds(scene, preset, preset.selected_object, title_frame)
                     if title_object_preset.type == 'TEXT' and title_object_preset.word_wrap:
                         #display text bounding box
                         camera_width = scene.render.resolution_x
@@ -918,10 +1270,9 @@ def quicktitling_overlay():
                         wrap_x_per = title_object_preset.x
                         wrap_width = wrap_width_per * camera_width
                         wrap_x = (wrap_x_per * (camera_width / 2)) - (wrap_width / 2)
-                        w_left, very_bottom = view.view_to_region(wrap_x, 0, clip=False)
-                        w_right, very_bottom = view.view_to_region(wrap_x + wrap_width, 0, clip=False)
-                        draw_box(w_left, bottom, w_right, top, color=(.5, .5, 0, 1))
-                    draw_box(left, bottom, right, top)
+                        boxes.append((wrap_x, min_y, wrap_x + wrap_width, max_y, (.5, .5, 0, 1)))
+                    boxes.append((min_x, min_y, max_x, max_y, (1.0, 1.0, 0.0, 1.0)))
+                    draw_boxes(boxes, transform)
                     draw_text(10, 10, 15, overlay_info)
 
 
@@ -940,6 +1291,67 @@ def update_bounds(title_object, title_object_preset, title_scene, scale_multipli
     title_object_preset.bbtop = bounds[3]
 
 
+def curve_segments(radius, angle, error, maximum):
+    #returns the number of straight segments needed for an arc of the given pixel radius and angle to stay within the pixel error
+    if radius <= error:
+        return 1
+    segment_angle = 2 * acos(1 - (error / radius))
+    return int(clamp(ceil(angle / segment_angle), 1, maximum))
+
+
+def update_curve_resolution(scene, quicktitle, object_layer, title_object, object_preset, scale_multiplier, settings):
+    #Sets the curve and bevel resolution of a circle, box or text object to the lowest values that keep it within the allowed pixel error.
+    #The size is taken from the cached screen bounds at the largest size the object is animated to, the preset bevel resolution is the most that will be used.
+    if object_preset.type not in ['CIRCLE', 'BOX', 'TEXT']:
+        return
+    render = scene.render
+    curve = title_object.data
+    if object_preset.type == 'BOX':
+        maximum_resolution = 1
+    else:
+        maximum_resolution = 12
+    resolution_u = maximum_resolution
+    bevel_resolution = object_preset.bevel_resolution
+
+    if settings.adaptive_resolution:
+        object_bounds(scene, quicktitle, object_layer, scene.frame_start)
+        rest_size = max(object_preset.bbright - object_preset.bbleft, object_preset.bbtop - object_preset.bbbottom)
+        width = object_preset.bbright - object_preset.bbleft
+        height = object_preset.bbtop - object_preset.bbbottom
+        start_frame, bounds = animated_bounds.get(title_object.name, (0, None))
+        if bounds is not None and len(bounds) > 0:
+            width = float(numpy.max(bounds[:, 2] - bounds[:, 0]))
+            height = float(numpy.max(bounds[:, 3] - bounds[:, 1]))
+        if rest_size > 0:
+            zoom = max(1.0, max(width, height) / rest_size)
+        else:
+            zoom = 1.0
+
+        #screen bounds are clamped to the frame, so an object filling the frame may be much larger than it looks
+        if width < render.resolution_x - 1 and height < render.resolution_y - 1:
+            #bounds are measured at full resolution, the title is rendered smaller if the render percentage is lowered in the title scene or the scene it is edited in
+            percentage = render.resolution_percentage / 100
+            edit_scene = settings.id_data
+            if edit_scene != scene:
+                percentage = percentage * edit_scene.render.resolution_percentage / 100
+            width = width * percentage
+            height = height * percentage
+            error = settings.resolution_error
+            if object_preset.type == 'CIRCLE':
+                #circles are made of 8 spans, each an eighth of the circle
+                resolution_u = curve_segments(max(width, height) / 2, pi / 4, error, maximum_resolution)
+            elif object_preset.type == 'TEXT':
+                #the tightest curves of most letters are about a quarter of the line height across
+                lines = curve.body.count('\n') + 1
+                resolution_u = curve_segments(height / lines / 4, pi / 2, error, maximum_resolution)
+            object_scale = max(abs(title_object.scale[0]), abs(title_object.scale[1]))
+            bevel_radius = curve.bevel_depth * object_scale * (render.resolution_x * percentage / 2) / scale_multiplier * zoom
+            bevel_resolution = min(bevel_resolution, curve_segments(bevel_radius, pi / 2, error, bevel_resolution + 1) - 1)
+
+    set_if_changed(curve, 'resolution_u', resolution_u)
+    set_if_changed(curve, 'bevel_resolution', bevel_resolution)
+
+
 def generate_matrix_world(ob, ob_preset):
     scale_matrix = mathutils.Matrix.Scale(ob.scale[0], 4, (1, 0, 0)) @ mathutils.Matrix.Scale(ob.scale[1], 4, (0, 1, 0)) @ mathutils.Matrix.Scale(ob.scale[2], 4, (0, 0, 1))
     rotation_matrix = mathutils.Matrix.Rotation(ob.rotation_euler[0], 4, 'X') @ mathutils.Matrix.Rotation(ob.rotation_euler[1], 4, 'Y') @ mathutils.Matrix.Rotation(ob.rotation_euler[2], 4, 'Z')
@@ -954,24 +1366,114 @@ def generate_matrix_world(ob, ob_preset):
     return matrix
 
 
-def camera_view_bounds_2d(scene, camera, title_object, title_object_preset, camera_x, camera_y, scale_multiplier, pos_multiplier):
+def bounds_points(title_object):
+    #returns the local points used to find the screen bounds of an object
     if title_object.type == 'MESH':
         #forget about the bounding box and just use the mesh itself
-        bbox = title_object.data.vertices
+        return [vert.co for vert in title_object.data.vertices]
     elif title_object.type == 'FONT':
         #well what do you know, this bounding box actually works correctly!
-        bbox = title_object.bound_box
+        return title_object.bound_box
     else:
         #use the curve points
-        bbox = title_object.data.splines[0].points
+        return [vert.co for vert in title_object.data.splines[0].points]
+
+
+def object_bounds(scene, quicktitle, object_layer, frame):
+    #Returns the screen bounds (left, bottom, right, top) of an object at the given frame of the title scene.
+    #Objects with animated transforms have their bounds calculated for every frame of the title at once, these are stored until the object is updated.
+    object_preset = quicktitle.objects[object_layer]
+    stored_bounds = (object_preset.bbleft, object_preset.bbbottom, object_preset.bbright, object_preset.bbtop)
+    name = object_preset.internal_name
+    if name not in scene.objects:
+        return stored_bounds
+    if name not in animated_bounds:
+        z_scale = quicktitle.z_scale / 10.0
+        scale_multiplier = (z_scale * (object_layer * 0.462)) + 1
+        render = bpy.context.scene.render
+        animated_bounds[name] = (scene.frame_start, calculate_animated_bounds(scene.objects[name], object_preset, scene.frame_start, scene.frame_end, scale_multiplier, render.resolution_x, render.resolution_y))
+    start_frame, bounds = animated_bounds[name]
+    if bounds is None:
+        return stored_bounds
+    index = clamp(frame - start_frame, 0, len(bounds) - 1)
+    return tuple(bounds[index])
+
+
+def calculate_animated_bounds(title_object, title_object_preset, frame_start, frame_end, camera_x_scale, camera_x, camera_y):
+    #Calculates the screen bounds of an object for a range of frames in one pass, using the same math as camera_view_bounds_2d.
+    #Returns an array of (left, bottom, right, top) for each frame, or None if the object's transforms are not animated.
+    frames = numpy.arange(frame_start, frame_end + 1, dtype=numpy.float64)
+    frame_count = len(frames)
+    if frame_count < 1:
+        return None
+    location = numpy.tile(numpy.array(title_object.location, dtype=numpy.float64), (frame_count, 1))
+    rotation = numpy.tile(numpy.array(title_object.rotation_euler, dtype=numpy.float64), (frame_count, 1))
+    scale = numpy.tile(numpy.array(title_object.scale, dtype=numpy.float64), (frame_count, 1))
+    transforms = {'location': location, 'rotation_euler': rotation, 'scale': scale}
+    animated = False
+    if title_object.animation_data and title_object.animation_data.action:
+        fcurves = get_action_fcurves(title_object.animation_data.action)
+        if fcurves:
+            for fcurve in fcurves:
+                if fcurve.data_path in transforms and 0 <= fcurve.array_index < 3:
+                    transforms[fcurve.data_path][:, fcurve.array_index] = [fcurve.evaluate(frame) for frame in frames]
+                    animated = True
+    if not animated:
+        return None
+    points = numpy.array([tuple(point)[:3] for point in bounds_points(title_object)], dtype=numpy.float64)
+    if len(points) == 0:
+        return None
+
+    #build the rotation matrices for all frames, matching generate_matrix_world
+    cos = numpy.cos(rotation)
+    sin = numpy.sin(rotation)
+    rotate_x = numpy.zeros((frame_count, 3, 3))
+    rotate_x[:, 0, 0] = 1
+    rotate_x[:, 1, 1] = cos[:, 0]
+    rotate_x[:, 1, 2] = -sin[:, 0]
+    rotate_x[:, 2, 1] = sin[:, 0]
+    rotate_x[:, 2, 2] = cos[:, 0]
+    rotate_y = numpy.zeros((frame_count, 3, 3))
+    rotate_y[:, 0, 0] = cos[:, 1]
+    rotate_y[:, 0, 2] = sin[:, 1]
+    rotate_y[:, 1, 1] = 1
+    rotate_y[:, 2, 0] = -sin[:, 1]
+    rotate_y[:, 2, 2] = cos[:, 1]
+    rotate_z = numpy.zeros((frame_count, 3, 3))
+    rotate_z[:, 0, 0] = cos[:, 2]
+    rotate_z[:, 0, 1] = -sin[:, 2]
+    rotate_z[:, 1, 0] = sin[:, 2]
+    rotate_z[:, 1, 1] = cos[:, 2]
+    rotate_z[:, 2, 2] = 1
+    rotation_matrix = numpy.transpose(rotate_x @ rotate_y @ rotate_z, (0, 2, 1))
+    matrix = scale[:, :, None] * rotation_matrix
+    if title_object_preset.type == 'CIRCLE':
+        #same position correction as generate_matrix_world
+        location = location * 2.83
+    transformed = numpy.einsum('fij,nj->fni', matrix, points) + location[:, None, :]
+
+    min_x = transformed[:, :, 0].min(axis=1) / camera_x_scale
+    max_x = transformed[:, :, 0].max(axis=1) / camera_x_scale
+    min_y = transformed[:, :, 1].min(axis=1) / camera_x_scale
+    max_y = transformed[:, :, 1].max(axis=1) / camera_x_scale
+    camera_x_half = (camera_x / 2)
+    camera_y_half = (camera_y / 2)
+    bounds = numpy.stack([
+        numpy.clip(min_x * camera_x_half, -camera_x_half, camera_x_half),
+        numpy.clip(min_y * camera_x_half, -camera_y_half, camera_y_half),
+        numpy.clip(max_x * camera_x_half, -camera_x_half, camera_x_half),
+        numpy.clip(max_y * camera_x_half, -camera_y_half, camera_y_half)], axis=1)
+    return bounds.astype(numpy.float32)
+
+
+def camera_view_bounds_2d(scene, camera, title_object, title_object_preset, camera_x, camera_y, scale_multiplier, pos_multiplier):
+    bbox = bounds_points(title_object)
     xs = []
     ys = []
     #matrix = title_object.matrix_world
     matrix = generate_matrix_world(title_object, title_object_preset)
 
     for vert in bbox:
-        if title_object.type != 'FONT':
-            vert = vert.co
         transformed_vert = matrix @ mathutils.Vector(vert)
         xs.append(transformed_vert[0])
         ys.append(transformed_vert[1])
@@ -1032,6 +1534,503 @@ def get_presets_directory():
     return directory+os.path.sep+'QuickTitling Presets'
 
 
+def is_title_scene(scene):
+    #determines if a scene was created by QuickTitling
+    return bool(scene.quicktitler.current_quicktitle.lampcenter_internal_name) and scene.quicktitler.current_quicktitle.lampcenter_internal_name in scene.objects
+
+
+def title_scenes():
+    #returns a list of all QuickTitling scenes in the blend file
+    return [scene for scene in bpy.data.scenes if is_title_scene(scene)]
+
+
+def apply_render_profile(scene, profile):
+    #sets the eevee settings of a title scene to one of the render profiles
+    for setting, value in render_profiles[profile].items():
+        if getattr(scene.eevee, setting) != value:
+            setattr(scene.eevee, setting, value)
+
+
+def render_profile_update(self=None, context=None):
+    #applies the selected render profile to all title scenes
+    for scene in title_scenes():
+        apply_render_profile(scene, self.render_profile)
+
+
+def current_render_profile():
+    #returns the render profile selected in the editing scenes, title scenes are also rendered directly so the profile cant be taken from the rendered scene
+    for scene in bpy.data.scenes:
+        if scene.quicktitler.render_profile != 'FINAL' and not is_title_scene(scene):
+            return scene.quicktitler.render_profile
+    return 'FINAL'
+
+
+@persistent
+def quicktitle_render_init(scene, depsgraph=None):
+    #switch all titles to the final render profile when rendering
+    if current_render_profile() != 'FINAL':
+        for title_scene in title_scenes():
+            apply_render_profile(title_scene, 'FINAL')
+
+
+@persistent
+def quicktitle_render_complete(scene, depsgraph=None):
+    #switch all titles back to the selected render profile after rendering
+    profile = current_render_profile()
+    if profile != 'FINAL':
+        for title_scene in title_scenes():
+            apply_render_profile(title_scene, profile)
+
+
+def get_cache_directory():
+    #returns the folder that rendered title frames are cached in, next to the blend file if it has been saved
+    if bpy.data.filepath:
+        return bpy.path.abspath('//QuickTitling Cache')
+    else:
+        return os.path.join(tempfile.gettempdir(), 'QuickTitling Cache')
+
+
+def preset_state(data, exclude=('rna_type', 'name', 'description', 'selected_object', 'selected_animation', 'bbleft', 'bbright', 'bbtop', 'bbbottom', 'missing_glyphs')):
+    #returns a tuple of all the values in a preset that can change how it looks, used to detect changes to the preset
+    state = []
+    for prop in data.bl_rna.properties:
+        if prop.identifier in exclude:
+            continue
+        value = getattr(data, prop.identifier)
+        if prop.type == 'COLLECTION':
+            value = tuple(preset_state(item, exclude) for item in value)
+        elif prop.type == 'POINTER':
+            value = preset_state(value, exclude) if value else None
+        elif getattr(prop, 'is_array', False):
+            value = tuple(value)
+        state.append((prop.identifier, value))
+    return tuple(state)
+
+
+def file_state(filepath):
+    #returns the path and modified time of a file, used to detect changes to textures and fonts
+    path = bpy.path.abspath(filepath)
+    if os.path.isfile(path):
+        return (path, os.path.getmtime(path))
+    return (path, None)
+
+
+def title_state_hash(scene, settings, include_animation=True):
+    #Returns a hash of everything that affects the rendered frames of a title scene: the preset, render settings, and the files it uses.
+    #settings are the quicktitler settings of the scene the title is edited in, some of these change how the title objects are built.
+    #If include_animation is False, anything that only changes how the title is animated is left out, the animated values are hashed per frame by title_frame_hashes.
+    quicktitle = scene.quicktitler.current_quicktitle
+    render = scene.render
+    eevee = scene.eevee
+    if include_animation:
+        state = [bl_info['version'], preset_state(quicktitle)]
+        state.append((render.resolution_x, render.resolution_y, render.resolution_percentage, render.fps, render.fps_base, render.engine, render.film_transparent, scene.frame_start, scene.frame_end))
+    else:
+        exclude = ('rna_type', 'name', 'description', 'selected_object', 'selected_animation', 'bbleft', 'bbright', 'bbtop', 'bbbottom', 'animations', 'length', 'glyph_stagger', 'glyph_reverse')
+        state = [bl_info['version'], preset_state(quicktitle, exclude)]
+        state.append((render.resolution_x, render.resolution_y, render.resolution_percentage, render.engine, render.film_transparent))
+    if current_render_profile() != 'FINAL':
+        #titles are always rendered with the final profile
+        state.append((eevee.use_shadows, sorted(render_profiles['FINAL'].items())))
+    else:
+        state.append((eevee.use_shadows, eevee.taa_render_samples, eevee.use_raytracing, eevee.shadow_ray_count, eevee.shadow_step_count))
+    if settings.adaptive_resolution:
+        #curve resolution depends on the render size in the edited scene as well
+        state.append((settings.adaptive_resolution, settings.resolution_error, settings.id_data.render.resolution_percentage))
+    if settings.use_fallback_font:
+        #characters missing from a font are drawn with the fallback font set in the edited scene
+        state.append((settings.use_fallback_font, settings.fallback_font))
+    for object_preset in quicktitle.objects:
+        if object_preset.texture:
+            state.append(file_state(object_preset.texture))
+        if object_preset.alpha_texture:
+            state.append(file_state(object_preset.alpha_texture))
+        if object_preset.set_material and object_preset.set_material_name in bpy.data.materials:
+            #manually set materials may be edited outside of the preset
+            material = bpy.data.materials[object_preset.set_material_name]
+            if material.node_tree:
+                for node in material.node_tree.nodes:
+                    for node_input in node.inputs:
+                        value = getattr(node_input, 'default_value', None)
+                        if hasattr(value, '__len__'):
+                            value = tuple(value)
+                        state.append((material.name, node.name, node_input.identifier, value))
+    for title_object in scene.objects:
+        if title_object.type == 'FONT' and title_object.data.font and title_object.data.font.filepath != '<builtin>':
+            state.append(file_state(title_object.data.font.filepath))
+        if title_object.type == 'FONT' and title_object.data.font_bold_italic and title_object.data.font_bold_italic.filepath != '<builtin>':
+            #the fallback font is loaded as the bold italic font
+            state.append(file_state(title_object.data.font_bold_italic.filepath))
+    return hashlib.sha1(repr(state).encode('utf-8')).hexdigest()
+
+
+def animation_ranges(animation_preset, start_frame, end_frame, delay=0):
+    #Returns the frame ranges in which an animation preset changes the object, delay is added to the end of each range for staggered glyph animations
+    ranges = []
+    in_start = start_frame + animation_preset.in_offset
+    out_end = end_frame + animation_preset.out_offset
+    if animation_preset.animate_in:
+        ranges.append((in_start, in_start + animation_preset.in_length + delay))
+    if animation_preset.animate_out:
+        ranges.append((out_end - animation_preset.out_length, out_end + delay))
+    if animation_preset.cycle_type != 'NONE':
+        #cycles change the object over the whole animation
+        ranges.append((in_start if animation_preset.animate_in else start_frame, (out_end if animation_preset.animate_out else end_frame) + delay))
+    return ranges
+
+
+def title_fade(quicktitle):
+    #Returns the alpha animation and object alpha if every visible object fades in exactly the same way, otherwise None.
+    #A fade like this can be done by the opacity of a strip instead of rendering every frame.
+    fade = None
+    fade_settings = None
+    for object_preset in quicktitle.objects:
+        if not object_preset.visible:
+            continue
+        alpha_animations = [animation_preset for animation_preset in object_preset.animations if animation_preset.variable == 'Alpha']
+        if len(alpha_animations) != 1 or use_glyphs(object_preset) or object_preset.alpha <= 0:
+            return None
+        animation_preset = alpha_animations[0]
+        if animation_preset.cycle_type != 'NONE':
+            return None
+        settings = (animation_preset.animate_in, animation_preset.animate_out, animation_preset.in_length, animation_preset.out_length, animation_preset.in_offset, animation_preset.out_offset, round(animation_preset.in_amount / object_preset.alpha, 4), round(animation_preset.out_amount / object_preset.alpha, 4))
+        if fade_settings is None:
+            fade_settings = settings
+            fade = (animation_preset, object_preset.alpha)
+        elif fade_settings != settings:
+            return None
+    return fade
+
+
+def title_frame_map(scene):
+    #Finds the frames of a title scene where nothing is animated.
+    #Returns a dictionary of each title frame and the frame that should be rendered for it, and a fade that can be applied as strip opacity (or None) with a frame that is not faded.
+    quicktitle = scene.quicktitler.current_quicktitle
+    start_frame = scene.frame_start
+    end_frame = scene.frame_end
+    all_frames = range(start_frame, end_frame + 1)
+    fade = title_fade(quicktitle)
+    dynamic_frames = set()
+    fade_frames = set()
+    for object_preset in quicktitle.objects:
+        if not object_preset.visible:
+            continue
+        if object_preset.type == 'IMAGE' and os.path.splitext(object_preset.texture)[1].lower() in bpy.path.extensions_movie:
+            #video textures change every frame
+            dynamic_frames.update(all_frames)
+        object_end_frame = end_frame
+        delay = 0
+        if use_glyphs(object_preset) and object_preset.internal_name in scene.objects:
+            glyphs = get_glyphs(scene.objects[object_preset.internal_name])
+            if glyphs:
+                units = max(glyph.get('quicktitle_glyph_unit', 0) for glyph in glyphs) + 1
+                delay = (units - 1) * object_preset.glyph_stagger
+                object_end_frame = end_frame - delay
+        for animation_preset in object_preset.animations:
+            for first, last in animation_ranges(animation_preset, start_frame, object_end_frame, delay):
+                frames = range(max(int(floor(first)), start_frame), min(int(ceil(last)), end_frame) + 1)
+                if fade and animation_preset.variable == 'Alpha':
+                    fade_frames.update(frames)
+                else:
+                    dynamic_frames.update(frames)
+    full_frame = None
+    if fade:
+        unfaded_frames = [frame for frame in all_frames if frame not in fade_frames]
+        if unfaded_frames:
+            full_frame = unfaded_frames[0]
+        else:
+            #object is never fully visible, the fade must be rendered
+            dynamic_frames.update(fade_frames)
+            fade = None
+
+    frame_map = {}
+    render_frame = None
+    for frame in all_frames:
+        if frame in dynamic_frames:
+            frame_map[frame] = frame
+            render_frame = None
+        else:
+            if render_frame is None:
+                render_frame = frame
+            frame_map[frame] = render_frame
+    if fade:
+        return frame_map, fade + (full_frame, )
+    return frame_map, None
+
+
+def title_alpha_fcurves(scene):
+    #returns the node trees and fcurves animating the alpha of all materials in a title scene
+    fcurves = []
+    for title_object in scene.objects:
+        material = get_material(title_object) if title_object.type in ['MESH', 'CURVE', 'FONT'] else None
+        if material and material.node_tree and material.node_tree.animation_data and material.node_tree.animation_data.action:
+            material_fcurves = get_action_fcurves(material.node_tree.animation_data.action)
+            if material_fcurves:
+                for fcurve in material_fcurves:
+                    if (material.node_tree, fcurve) not in fcurves:
+                        fcurves.append((material.node_tree, fcurve))
+    return fcurves
+
+
+def hold_title_fade(scene, fade):
+    #Sets the alpha of all materials to the unfaded value and mutes their animation, the fade will be done by the cache strip instead.
+    #Returns the fcurves that were muted.
+    muted = []
+    if fade:
+        for node_tree, fcurve in title_alpha_fcurves(scene):
+            if fcurve.mute:
+                continue
+            value = fcurve.evaluate(fade[2])
+            path, attribute = fcurve.data_path.rsplit('.', 1)
+            owner = node_tree.path_resolve(path)
+            current = getattr(owner, attribute)
+            if hasattr(current, '__len__'):
+                current[fcurve.array_index] = value
+            else:
+                setattr(owner, attribute, value)
+            fcurve.mute = True
+            muted.append(fcurve)
+    return muted
+
+
+def title_frame_hashes(scene, settings, frames, fade):
+    #Returns a hash of the evaluated state of a title scene at each of the given frames.
+    #Frames that look the same will have the same hash, even if they are in a different version of the title, so they only need to be rendered once.
+    static_hash = title_state_hash(scene, settings, include_animation=False)
+    quicktitle = scene.quicktitler.current_quicktitle
+    video = any(object_preset.visible and os.path.splitext(object_preset.texture)[1].lower() in bpy.path.extensions_movie for object_preset in quicktitle.objects if object_preset.type == 'IMAGE')
+
+    #find all animation curves in the scene, with the frame offset and range of glyph strips
+    curves = []
+    for title_object in scene.objects:
+        animation_data = title_object.animation_data
+        if animation_data:
+            if animation_data.action:
+                fcurves = get_action_fcurves(animation_data.action)
+                if fcurves:
+                    for fcurve in fcurves:
+                        curves.append((title_object.name, fcurve, 0, None))
+            for track in animation_data.nla_tracks:
+                for strip in track.strips:
+                    if strip.action:
+                        fcurves = get_action_fcurves(strip.action)
+                        if fcurves:
+                            for fcurve in fcurves:
+                                curves.append((title_object.name, fcurve, strip.frame_start - strip.action_frame_start, (strip.action_frame_start, strip.action_frame_end)))
+    if not fade:
+        #held fades are not rendered, so they dont change the frame
+        for node_tree, fcurve in title_alpha_fcurves(scene):
+            curves.append((node_tree.name, fcurve, 0, None))
+
+    hashes = {}
+    for frame in frames:
+        values = [static_hash, bool(fade)]
+        if video:
+            values.append(frame)
+        for name, fcurve, offset, frame_range in curves:
+            local_frame = frame - offset
+            if frame_range:
+                local_frame = clamp(local_frame, frame_range[0], frame_range[1])
+            values.append((name, fcurve.data_path, fcurve.array_index, round(fcurve.evaluate(local_frame), 5)))
+        hashes[frame] = hashlib.sha1(repr(values).encode('utf-8')).hexdigest()
+    return hashes
+
+
+def link_cache_file(source, destination):
+    #makes a file available at a second location, without using more disk space if possible
+    try:
+        os.link(source, destination)
+    except:
+        shutil.copyfile(source, destination)
+
+
+def store_cache_frames(directory, frame_hashes):
+    #Adds rendered frames of a title to the shared frame store, and fills in frames of the title that look the same as a stored frame
+    store = os.path.join(get_cache_directory(), 'Frames')
+    os.makedirs(store, exist_ok=True)
+    for frame, frame_hash in frame_hashes.items():
+        frame_path = os.path.join(directory, str(frame).zfill(5)+'.png')
+        stored_path = os.path.join(store, frame_hash+'.png')
+        if os.path.isfile(frame_path) and not os.path.isfile(stored_path):
+            link_cache_file(frame_path, stored_path)
+    for frame, frame_hash in frame_hashes.items():
+        frame_path = os.path.join(directory, str(frame).zfill(5)+'.png')
+        stored_path = os.path.join(store, frame_hash+'.png')
+        if not os.path.isfile(frame_path) and os.path.isfile(stored_path):
+            link_cache_file(stored_path, frame_path)
+
+
+def title_cache_plan(scene, settings):
+    #Finds where the frames of a title scene are cached and which frames still need to be rendered.
+    #Frames that look the same as a frame that was already rendered, in any title, are taken from the frame store instead of being rendered.
+    #Returns the cache folder, a dictionary of title frame to rendered frame, the fade (or None), the state hash, the frames that need to be rendered, and the hashes of all frames that were missing.
+    frame_map, fade = title_frame_map(scene)
+    state_hash = title_state_hash(scene, settings)
+    if fade:
+        #frames are rendered without the fade, so they are stored separately from frames rendered with it
+        state_hash = state_hash+'-fade'
+    directory = os.path.join(get_cache_directory(), state_hash)
+    missing_frames = [frame for frame in sorted(set(frame_map.values())) if not os.path.isfile(os.path.join(directory, str(frame).zfill(5)+'.png'))]
+    frame_hashes = {}
+    render_frames = []
+    if missing_frames:
+        #the cache folder is only made once there are frames to put in it
+        os.makedirs(directory, exist_ok=True)
+        frame_hashes = title_frame_hashes(scene, settings, missing_frames, fade)
+        store_cache_frames(directory, frame_hashes)
+        #only one frame of each evaluated state needs to be rendered
+        rendered_hashes = []
+        for frame in missing_frames:
+            if not os.path.isfile(os.path.join(directory, str(frame).zfill(5)+'.png')) and frame_hashes[frame] not in rendered_hashes:
+                rendered_hashes.append(frame_hashes[frame])
+                render_frames.append(frame)
+    return directory, frame_map, fade, state_hash, render_frames, frame_hashes
+
+
+def render_title_frames(scene, directory, frames, fade):
+    #Renders the given frames of a title scene to numbered png files in a folder, if there is a fade it will be held at the unfaded value
+    old_filepath = scene.render.filepath
+    oldscene = bpy.context.scene
+    bpy.context.window.scene = scene
+    muted = []
+    try:
+        muted = hold_title_fade(scene, fade)
+        for frame in frames:
+            scene.frame_current = frame
+            scene.render.filepath = os.path.join(directory, str(frame).zfill(5)+'.png')
+            bpy.ops.render.render(write_still=True)
+    finally:
+        for fcurve in muted:
+            fcurve.mute = False
+        bpy.context.window.scene = oldscene
+        scene.render.filepath = old_filepath
+
+
+def render_thumbnail(scene, imagepath, size=300):
+    #Renders the middle frame of a title scene to a small jpg, a temporary copy of the scene is rendered so the title settings are never changed
+    thumbnail_scene = scene.copy()
+    try:
+        aspect = scene.render.resolution_x / scene.render.resolution_y
+        thumbnail_scene.render.resolution_x = size
+        thumbnail_scene.render.resolution_y = int(size / aspect)
+        thumbnail_scene.render.resolution_percentage = 100
+        thumbnail_scene.render.film_transparent = False
+        thumbnail_scene.render.image_settings.file_format = 'JPEG'
+        thumbnail_scene.render.image_settings.quality = 80
+        thumbnail_scene.render.image_settings.color_mode = 'RGB'
+        thumbnail_scene.render.filepath = imagepath
+        thumbnail_scene.frame_current = int(round(scene.frame_end / 2))
+        bpy.ops.render.render(write_still=True, scene=thumbnail_scene.name)
+    finally:
+        bpy.data.scenes.remove(thumbnail_scene)
+
+
+def render_preset_thumbnails(directory):
+    #Loads each preset file in a folder into a temporary title scene and renders a thumbnail for it, returns the number of thumbnails rendered
+    #The presets are loaded into the current title preset, this is put back afterwards and all data made for the thumbnails is removed.
+    #Auto updates are held off the whole time so loading presets does not change the selected title.
+    global suspend_autoupdate
+    settings = bpy.context.scene.quicktitler
+    preset = settings.current_quicktitle
+    old_preset = preset_snapshot(preset, exclude=('rna_type', ))
+    existing = {datablock_type: set(getattr(bpy.data, datablock_type)) for datablock_type in thumbnail_datablock_types}
+    window = bpy.context.window
+    oldscene = bpy.context.scene
+    rendered = 0
+    suspended = suspend_autoupdate
+    suspend_autoupdate = True
+    try:
+        for file in sorted(os.listdir(directory)):
+            if not file.lower().endswith('.xml'):
+                continue
+            filepath = os.path.join(directory, file)
+            try:
+                load_quicktitle(filepath, preset)
+            except:
+                print('Unable to load QuickTitling preset: '+filepath)
+                continue
+            title_scene = create_title_scene(preset)
+            try:
+                #title scenes are always updated while they are the window scene, there is no window when running in the background
+                if window:
+                    window.scene = title_scene
+                update_title_scene(title_scene, title_scene.quicktitler.current_quicktitle, settings, update_all=True)
+                render_thumbnail(title_scene, os.path.splitext(filepath)[0]+'.jpg')
+                rendered = rendered + 1
+            finally:
+                if window:
+                    window.scene = oldscene
+                for title_object in list(title_scene.objects):
+                    bpy.data.objects.remove(title_object)
+                bpy.data.scenes.remove(title_scene)
+                remove_unused_data(existing)
+    finally:
+        preset_restore(preset, old_preset)
+        suspend_autoupdate = suspended
+    return rendered
+
+
+def remove_unused_data(existing):
+    #Removes datablocks that were added since the existing sets were made and are no longer used by anything
+    for datablock_type in thumbnail_datablock_types:
+        datablocks = getattr(bpy.data, datablock_type)
+        for datablock in list(datablocks):
+            if datablock not in existing[datablock_type] and datablock.users == 0:
+                datablocks.remove(datablock)
+    clean_glyph_meshes()
+
+
+def add_frames_strip(scene, sequence, directory, frame_map, fade, name):
+    #Places rendered frames of a title over its strip and mutes the title strip, static frames are repeated and fades are applied as strip opacity
+    title_scene = sequence.scene
+    frames = range(title_scene.frame_start, title_scene.frame_end + 1)
+    sequence_editor = scene.sequence_editor
+    strip = sequence_editor.strips.new_image(name=name, filepath=os.path.join(directory, str(frame_map[title_scene.frame_start]).zfill(5)+'.png'), channel=sequence.channel + 1, frame_start=int(sequence.frame_start))
+    for frame in frames[1:]:
+        strip.elements.append(str(frame_map[frame]).zfill(5)+'.png')
+    strip.blend_type = 'ALPHA_OVER'
+    if fade:
+        animation_preset, alpha, full_frame = fade
+        points = animation_points(animation_preset, title_scene.frame_start, title_scene.frame_end, animation_preset.in_amount / alpha, 1, animation_preset.out_amount / alpha)
+        for frame, value in points:
+            strip.blend_alpha = clamp(value, 0, 1)
+            strip.keyframe_insert('blend_alpha', frame=frame + sequence.frame_start)
+    sequence.mute = True
+    return strip
+
+
+def add_cache_strip(scene, sequence, directory, frame_map, fade, state_hash):
+    #Places the cached frames of a title over its strip, the strip will be removed when the title is changed
+    settings = sequence.scene.quicktitler
+    remove_title_cache(sequence)
+    strip = add_frames_strip(scene, sequence, directory, frame_map, fade, 'QuickTitle Cache: '+settings.current_quicktitle.name)
+    settings.cache_strip = strip.name
+    settings.cache_hash = state_hash
+    return strip
+
+
+def remove_title_cache(sequence):
+    #removes the cached frames strip of a title, and enables the title strip again
+    settings = sequence.scene.quicktitler
+    if settings.cache_strip:
+        sequence_editor = bpy.context.scene.sequence_editor
+        if sequence_editor:
+            strip = sequence_editor.strips_all.get(settings.cache_strip)
+            if strip:
+                #remove the opacity fade of the strip
+                animation_data = bpy.context.scene.animation_data
+                if animation_data and animation_data.action:
+                    fcurves = get_action_fcurves(animation_data.action)
+                    if fcurves:
+                        for fcurve in reversed(list(fcurves)):
+                            if '["'+strip.name+'"]' in fcurve.data_path:
+                                fcurves.remove(fcurve)
+                sequence_editor.strips.remove(strip)
+        sequence.mute = False
+        settings.cache_strip = ''
+        settings.cache_hash = ''
+
+
 def list_quicktitle_presets(scene):
     presets = []
     #Load up scene presets
@@ -1177,6 +2176,13 @@ def load_quicktitle(filepath, preset):
             newobject.align = align
         else:
             newobject.align = 'CENTER'
+        glyph_mode = title_object.findtext('glyph_mode', default=str(get_default('glyph_mode')))
+        if glyph_mode in ['NONE', 'CHARACTER', 'WORD']:
+            newobject.glyph_mode = glyph_mode
+        else:
+            newobject.glyph_mode = 'NONE'
+        newobject.glyph_stagger = abs(int(title_object.findtext('glyph_stagger', default=str(get_default('glyph_stagger')))))
+        newobject.glyph_reverse = to_bool(title_object.findtext('glyph_reverse', default=str(get_default('glyph_reverse'))))
         newobject.outline = to_bool(title_object.findtext('outline', default=str(get_default('outline'))))
         newobject.outline_size = abs(float(title_object.findtext('outline_size', default=str(get_default('outline_size')))))
         outline_alpha = abs(float(title_object.findtext('outline_alpha', default=str(get_default('outline_alpha')))))
@@ -1283,96 +2289,104 @@ def current_quicktitle(sequence=None):
     return scene.quicktitler.current_quicktitle
 
 
+def pack_collection(collection, packed_fields):
+    #Reads number settings from every item in a collection at once, returns a dict of setting name: numpy array
+    packed = {}
+    length = len(collection)
+    for field, (dtype, size) in packed_fields.items():
+        values = numpy.empty(length * size, dtype=dtype)
+        collection.foreach_get(field, values)
+        packed[field] = values
+    return packed
+
+
+def unpack_collection(collection, packed):
+    #Writes number settings read with pack_collection to every item in a collection at once
+    for field, values in packed.items():
+        collection.foreach_set(field, values)
+
+
+def object_type_exclude(object_type):
+    #returns the per-type settings that are not used by an object type
+    used = object_type_fields.get(object_type, ())
+    return tuple(set(field for fields in object_type_fields.values() for field in fields if field not in used))
+
+
+def preset_snapshot(data, exclude=snapshot_exclude):
+    #Stores the settings of a preset in a plain dict, in one pass over its properties.
+    #Lists are stored with the number settings of all their items packed together so they can be restored in bulk.
+    #Objects only store the text, enum and switch settings used by their type.
+    if isinstance(data, QuickTitleObject):
+        exclude = tuple(exclude) + object_type_exclude(data.type)
+    snapshot = {}
+    for prop in data.bl_rna.properties:
+        identifier = prop.identifier
+        if identifier in exclude:
+            continue
+        if prop.type == 'COLLECTION':
+            snapshot[identifier] = collection_snapshot(getattr(data, identifier), prop.fixed_type, exclude)
+        elif prop.type == 'POINTER' or prop.is_readonly:
+            continue
+        elif getattr(prop, 'is_array', False):
+            snapshot[identifier] = tuple(getattr(data, identifier))
+        else:
+            snapshot[identifier] = getattr(data, identifier)
+    return snapshot
+
+
+def collection_snapshot(collection, item_type, exclude):
+    #Stores a list of presets, float and int settings are read for all items at once and the rest are stored per item
+    packed_fields = {}
+    for prop in item_type.properties:
+        if prop.identifier in exclude or prop.is_readonly:
+            continue
+        if prop.type == 'FLOAT':
+            packed_fields[prop.identifier] = (numpy.float32, max(1, prop.array_length))
+        elif prop.type == 'INT':
+            packed_fields[prop.identifier] = (numpy.int32, max(1, prop.array_length))
+    item_exclude = tuple(exclude) + tuple(packed_fields.keys())
+    return {
+        'length': len(collection),
+        'packed': pack_collection(collection, packed_fields),
+        'items': [preset_snapshot(item, exclude=item_exclude) for item in collection]}
+
+
+def preset_restore(data, snapshot):
+    #Sets the settings of a preset from a dict made by preset_snapshot
+    #Auto updates are held off while the settings are set, callers update the title once afterwards if it is needed.
+    global suspend_autoupdate
+    suspended = suspend_autoupdate
+    suspend_autoupdate = True
+    try:
+        for identifier, value in snapshot.items():
+            if isinstance(value, dict):
+                collection = getattr(data, identifier)
+                collection.clear()
+                for index in range(value['length']):
+                    collection.add()
+                unpack_collection(collection, value['packed'])
+                for item, item_snapshot in zip(collection, value['items']):
+                    preset_restore(item, item_snapshot)
+            else:
+                setattr(data, identifier, value)
+    finally:
+        suspend_autoupdate = suspended
+
+
 def copy_object(oldobject, newobject):
-    newobject.name = oldobject.name
-    newobject.type = oldobject.type
-    newobject.x = oldobject.x
-    newobject.y = oldobject.y
-    newobject.z = oldobject.z
-    newobject.rot_x = oldobject.rot_x
-    newobject.rot_y = oldobject.rot_y
-    newobject.rot_z = oldobject.rot_z
-    newobject.scale = oldobject.scale
-    newobject.width = oldobject.width
-    newobject.height = oldobject.height
-    newobject.shear = oldobject.shear
-    newobject.set_material = oldobject.set_material
-    newobject.set_material_name = oldobject.set_material_name
-    newobject.material = oldobject.material
-    newobject.cast_shadows = oldobject.cast_shadows
-    newobject.use_shadeless = oldobject.use_shadeless
-    newobject.alpha = oldobject.alpha
-    newobject.index_of_refraction = oldobject.index_of_refraction
-    newobject.transmission = oldobject.transmission
-    newobject.diffuse_color = oldobject.diffuse_color
-    newobject.specular_intensity = oldobject.specular_intensity
-    newobject.metallic = oldobject.metallic
-    newobject.roughness = oldobject.roughness
-    newobject.extrude = oldobject.extrude
-    newobject.bevel = oldobject.bevel
-    newobject.bevel_resolution = oldobject.bevel_resolution
-    newobject.text = oldobject.text
-    newobject.font = oldobject.font
-    newobject.word_wrap = oldobject.word_wrap
-    newobject.wrap_width = oldobject.wrap_width
-    newobject.align = oldobject.align
-    newobject.outline = oldobject.outline
-    newobject.outline_size = oldobject.outline_size
-    newobject.outline_alpha = oldobject.outline_alpha
-    newobject.outline_diffuse_color = oldobject.outline_diffuse_color
-    newobject.window_mapping = oldobject.window_mapping
-    newobject.texture = oldobject.texture
-    newobject.alpha_texture = oldobject.alpha_texture
-    newobject.loop = oldobject.loop
-    newobject.frame_offset = oldobject.frame_offset
-    newobject.frame_length = oldobject.frame_length
-    newobject.animations.clear()
-    for oldanimation in oldobject.animations:
-        newanimation = newobject.animations.add()
-        copy_animation(oldanimation, newanimation)
-
-
-def copy_animation(oldanimation, newanimation):
-    newanimation.variable = oldanimation.variable
-    newanimation.animate_in = oldanimation.animate_in
-    newanimation.animate_out = oldanimation.animate_out
-    newanimation.in_length = oldanimation.in_length
-    newanimation.out_length = oldanimation.out_length
-    newanimation.in_offset = oldanimation.in_offset
-    newanimation.out_offset = oldanimation.out_offset
-    newanimation.in_amount = oldanimation.in_amount
-    newanimation.out_amount = oldanimation.out_amount
-    newanimation.cycle_x_scale = oldanimation.cycle_x_scale
-    newanimation.cycle_y_scale = oldanimation.cycle_y_scale
-    newanimation.cycle_offset = oldanimation.cycle_offset
-    newanimation.cycle_type = oldanimation.cycle_type
+    preset_restore(newobject, preset_snapshot(oldobject))
 
 
 def copy_title_preset(old_title, title):
     #Function to copy one QuickTitle preset to another
-    title.name = old_title.name
-    title.description = old_title.description
-    title.z_scale = old_title.z_scale
-    title.shadowsize = old_title.shadowsize
-    title.shadowamount = old_title.shadowamount
-    title.shadowsoft = old_title.shadowsoft
-    title.shadowx = old_title.shadowx
-    title.shadowy = old_title.shadowy
-    title.lightscalex = old_title.lightscalex
-    title.lightscaley = old_title.lightscaley
-    title.lightx = old_title.lightx
-    title.lighty = old_title.lighty
-    title.lightrot = old_title.lightrot
-    title.length = old_title.length
-    title.objects.clear()
-    for oldobject in old_title.objects:
-        newobject = title.objects.add()
-        copy_object(oldobject, newobject)
+    preset_restore(title, preset_snapshot(old_title))
 
 
 def quicktitle_autoupdate(self=None, context=None):
     #Auto update function called when changing settings
     #will update a selected title if autoupdate is enabled, should only update objects that are needed
+    if suspend_autoupdate:
+        return
     quicktitle = titling_scene_selected()
     if quicktitle:
         preset = quicktitle.scene.quicktitler.current_quicktitle
@@ -1386,6 +2400,8 @@ def quicktitle_autoupdate(self=None, context=None):
 def quicktitle_autoupdate_all(self=None, context=None):
     #Auto update function
     #will update a selected title if autoupdate is enabled, will update all objects in the scene
+    if suspend_autoupdate:
+        return
     quicktitle = titling_scene_selected()
     if quicktitle:
         preset = quicktitle.scene.quicktitler.current_quicktitle
@@ -1396,6 +2412,101 @@ def quicktitle_autoupdate_all(self=None, context=None):
         bpy.context.scene.quicktitler.current_edited = True
 
 
+def layer_multiplier(quicktitle, object_layer):
+    #Returns the position and scale multiplier update_title_scene uses for an object on the given layer
+    z_scale = quicktitle.z_scale / 10.0
+    return 1 + (z_scale * (object_layer * 0.462))
+
+
+def ratio(value, start):
+    #Returns how many times larger value is than start, a zero start value is treated as no change
+    if start == 0:
+        return 1.0
+    return value / start
+
+
+def preview_transform(scene, object_preset, location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1), extrude=None):
+    #Moves a title object and its outline without changing the preset, used while dragging in the preview area.
+    #The delta transforms are used so any keyframed animation on the objects is kept, calling with no offsets resets the objects.
+    name = object_preset.internal_name
+    if name not in scene.objects:
+        return
+    title_object = scene.objects[name]
+    preview_objects = [title_object]
+    outline_object_name = name+'outline'
+    if outline_object_name in scene.objects:
+        preview_objects.append(scene.objects[outline_object_name])
+    if extrude is not None and use_glyphs(object_preset):
+        #glyphs are made from cached meshes that the extrude of the text does not change, so they are stretched in depth instead
+        scale = (scale[0], scale[1], scale[2] * ratio(extrude / 10.0, title_object.data.extrude))
+        extrude = None
+    for preview_object in preview_objects:
+        preview_object.delta_location = location
+        preview_object.delta_rotation_euler = rotation
+        preview_object.delta_scale = scale
+    if extrude is not None and object_preset.type in ['CIRCLE', 'BOX', 'TEXT']:
+        set_if_changed(title_object.data, 'extrude', extrude / 10.0)
+    try:
+        bpy.ops.sequencer.refresh_all()
+    except:
+        pass
+
+
+def preview_lamp_transform(scene, quicktitle, x, y, z):
+    #Moves the shadow lamps without changing the preset, used while dragging in the preview area
+    if quicktitle.shadowlamp_internal_name in scene.objects and quicktitle.shadowlamp_inverse_internal_name in scene.objects:
+        scene.objects[quicktitle.shadowlamp_internal_name].location = (x, y, z)
+        scene.objects[quicktitle.shadowlamp_inverse_internal_name].location = (x, y, z)
+        try:
+            bpy.ops.sequencer.refresh_all()
+        except:
+            pass
+
+
+def preview_bounds(object_preset, start_bounds, offset=(0, 0), scale=(1, 1), restore=False):
+    #Moves or scales the stored screen bounds of an object from the bounds it had when dragging started.
+    #This is much faster than measuring the object again, the real bounds are found when the preset is committed.
+    global title_revision
+    if start_bounds is None:
+        return
+    left, bottom, right, top = start_bounds
+    if not restore:
+        #screen bounds are in pixels from the center of the frame, the y axis uses the width scale as well
+        half_width = bpy.context.scene.render.resolution_x / 2
+        center_x = object_preset.x * half_width
+        center_y = object_preset.y * half_width
+        left = center_x + (left - center_x) * scale[0] + offset[0] * half_width
+        right = center_x + (right - center_x) * scale[0] + offset[0] * half_width
+        bottom = center_y + (bottom - center_y) * scale[1] + offset[1] * half_width
+        top = center_y + (top - center_y) * scale[1] + offset[1] * half_width
+    object_preset.bbleft = min(left, right)
+    object_preset.bbbottom = min(bottom, top)
+    object_preset.bbright = max(left, right)
+    object_preset.bbtop = max(bottom, top)
+    if restore:
+        animated_bounds.pop(object_preset.internal_name, None)
+    else:
+        #use the stored bounds while dragging instead of the bounds cached for each frame
+        animated_bounds[object_preset.internal_name] = (0, None)
+    title_revision = title_revision + 1
+
+
+def commit_transform(data, values):
+    #Writes the values from a finished drag to a preset and runs one update of the title.
+    #Auto updates are held off while the values are set so the title is not rebuilt for every value.
+    global suspend_autoupdate
+    suspended = suspend_autoupdate
+    suspend_autoupdate = True
+    try:
+        for attribute, value in values.items():
+            setattr(data, attribute, value)
+    finally:
+        suspend_autoupdate = suspended
+    if hasattr(data, 'internal_name'):
+        animated_bounds.pop(data.internal_name, None)
+    quicktitle_autoupdate()
+
+
 def isimageloaded(filepath):
     #Function to check if an image is already loaded
     for image in bpy.data.images:
@@ -1404,6 +2515,279 @@ def isimageloaded(filepath):
     return None
 
 
+def read_font_names(filepath):
+    #Reads the family, style and full name from the name table of a ttf or otf font file, only the first font of a collection is read
+    #Returns a tuple of (family, style, full name), or None if the file cant be read
+    try:
+        with open(filepath, 'rb') as font_file:
+            data = font_file.read()
+        offset = 0
+        if data[:4] == b'ttcf':
+            offset = struct.unpack('>I', data[12:16])[0]
+        table_count = struct.unpack('>H', data[offset + 4:offset + 6])[0]
+        name_offset = None
+        for index in range(table_count):
+            record = offset + 12 + (index * 16)
+            tag, checksum, table_offset, length = struct.unpack('>4sIII', data[record:record + 16])
+            if tag == b'name':
+                name_offset = table_offset
+                break
+        if name_offset is None:
+            return None
+        name_format, count, string_offset = struct.unpack('>HHH', data[name_offset:name_offset + 6])
+        names = {}
+        for index in range(count):
+            record = name_offset + 6 + (index * 12)
+            platform_id, encoding_id, language_id, name_id, length, string_start = struct.unpack('>HHHHHH', data[record:record + 12])
+            if name_id not in [1, 2, 4, 16, 17]:
+                continue
+            start = name_offset + string_offset + string_start
+            raw = data[start:start + length]
+            if platform_id == 3 or platform_id == 0:
+                #prefer windows english names, these are the most common
+                text = raw.decode('utf-16-be', errors='ignore')
+                if name_id not in names or (platform_id == 3 and language_id == 0x409):
+                    names[name_id] = text
+            elif platform_id == 1 and name_id not in names:
+                names[name_id] = raw.decode('latin-1', errors='ignore')
+    except:
+        return None
+    family = names.get(16, names.get(1, ''))
+    style = names.get(17, names.get(2, 'Regular'))
+    full_name = names.get(4, (family+' '+style).strip())
+    if not family:
+        return None
+    return family, style, full_name
+
+
+def read_font_coverage(filepath):
+    #Reads the character map of a ttf or otf font file and returns a list of (first, last) character code ranges the font has glyphs for
+    #Only unicode maps in format 4 (basic plane) or 12 (full unicode) are read, returns None if neither is found
+    with open(filepath, 'rb') as font_file:
+        data = font_file.read()
+    offset = 0
+    if data[:4] == b'ttcf':
+        offset = struct.unpack('>I', data[12:16])[0]
+    table_count = struct.unpack('>H', data[offset + 4:offset + 6])[0]
+    cmap_offset = None
+    for index in range(table_count):
+        record = offset + 12 + (index * 16)
+        tag, checksum, table_offset, length = struct.unpack('>4sIII', data[record:record + 16])
+        if tag == b'cmap':
+            cmap_offset = table_offset
+            break
+    if cmap_offset is None:
+        return None
+    subtables = {}
+    subtable_count = struct.unpack('>H', data[cmap_offset + 2:cmap_offset + 4])[0]
+    for index in range(subtable_count):
+        record = cmap_offset + 4 + (index * 8)
+        platform_id, encoding_id, subtable_offset = struct.unpack('>HHI', data[record:record + 8])
+        subtable_start = cmap_offset + subtable_offset
+        subtable_format = struct.unpack('>H', data[subtable_start:subtable_start + 2])[0]
+        if (platform_id == 3 and encoding_id in [1, 10]) or platform_id == 0:
+            subtables.setdefault(subtable_format, subtable_start)
+
+    ranges = []
+    if 12 in subtables:
+        start = subtables[12]
+        group_count = struct.unpack('>I', data[start + 12:start + 16])[0]
+        for index in range(group_count):
+            group = start + 16 + (index * 12)
+            first, last, glyph = struct.unpack('>III', data[group:group + 12])
+            if glyph == 0:
+                first = first + 1
+            if first <= last:
+                ranges.append((first, last))
+    elif 4 in subtables:
+        start = subtables[4]
+        segment_count = struct.unpack('>H', data[start + 6:start + 8])[0] // 2
+        end_codes = struct.unpack('>'+str(segment_count)+'H', data[start + 14:start + 14 + segment_count * 2])
+        start_position = start + 16 + segment_count * 2
+        start_codes = struct.unpack('>'+str(segment_count)+'H', data[start_position:start_position + segment_count * 2])
+        delta_position = start_position + segment_count * 2
+        deltas = struct.unpack('>'+str(segment_count)+'H', data[delta_position:delta_position + segment_count * 2])
+        range_position = delta_position + segment_count * 2
+        range_offsets = struct.unpack('>'+str(segment_count)+'H', data[range_position:range_position + segment_count * 2])
+        for index in range(segment_count):
+            first = start_codes[index]
+            last = end_codes[index]
+            if first == 0xFFFF:
+                continue
+            if range_offsets[index] == 0:
+                missing = (-deltas[index]) & 0xFFFF
+                if first <= missing <= last:
+                    #the one character in this range that maps to the missing glyph
+                    ranges.extend([(first, missing - 1), (missing + 1, last)])
+                else:
+                    ranges.append((first, last))
+            else:
+                #glyphs for this range are looked up in an array, characters with glyph 0 are missing
+                run_start = None
+                for character in range(first, last + 1):
+                    glyph_position = range_position + index * 2 + range_offsets[index] + (character - first) * 2
+                    glyph = struct.unpack('>H', data[glyph_position:glyph_position + 2])[0] if glyph_position + 2 <= len(data) else 0
+                    if glyph != 0 and run_start is None:
+                        run_start = character
+                    elif glyph == 0 and run_start is not None:
+                        ranges.append((run_start, character - 1))
+                        run_start = None
+                if run_start is not None:
+                    ranges.append((run_start, last))
+    else:
+        return None
+    return [(first, last) for first, last in ranges if first <= last]
+
+
+def get_coverage_directory():
+    #returns the folder that font coverage tables are stored in
+    return os.path.join(bpy.utils.user_resource('DATAFILES', path='QuickTitling'), 'Font Coverage')
+
+
+def font_coverage(font):
+    #Returns a set of the character codes a font datablock can display, or None if the font file cant be read.
+    #Coverage is read from the font file once, then stored on disk and reused until the font file changes.
+    if font is None or font.filepath == '<builtin>' or font.packed_file:
+        return None
+    filepath = os.path.abspath(bpy.path.abspath(font.filepath))
+    try:
+        stat = os.stat(filepath)
+    except:
+        return None
+    cached = font_coverage_cache.get(filepath)
+    if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime:
+        return cached[2]
+
+    key = hashlib.sha1((filepath+'|'+str(stat.st_size)+'|'+str(stat.st_mtime)).encode('utf-8')).hexdigest()
+    coverage_file = os.path.join(get_coverage_directory(), key+'.json')
+    ranges = None
+    if os.path.isfile(coverage_file):
+        try:
+            with open(coverage_file) as stored:
+                ranges = json.load(stored)
+        except:
+            ranges = None
+    if ranges is None:
+        try:
+            ranges = read_font_coverage(filepath)
+        except:
+            ranges = None
+        if ranges is None:
+            font_coverage_cache[filepath] = (stat.st_size, stat.st_mtime, None)
+            return None
+        try:
+            os.makedirs(get_coverage_directory(), exist_ok=True)
+            with open(coverage_file, 'w') as stored:
+                json.dump(ranges, stored)
+        except:
+            pass
+    coverage = set()
+    for first, last in ranges:
+        coverage.update(range(first, last + 1))
+    font_coverage_cache[filepath] = (stat.st_size, stat.st_mtime, coverage)
+    return coverage
+
+
+def missing_characters(font, text):
+    #returns a string of the characters in a text that the font has no glyph for, in the order they first appear
+    coverage = font_coverage(font)
+    if coverage is None:
+        return ''
+    missing = []
+    for character in text:
+        if character.isspace() or character in missing:
+            continue
+        if ord(character) not in coverage:
+            missing.append(character)
+    return ''.join(missing)
+
+
+def set_fallback_font(text_data, missing, fallback):
+    #Shows the characters missing from a text's font using a fallback font.
+    #Blender can only change the font of single characters with the bold and italic styles, so the bold italic font is used as the fallback.
+    if fallback is not None:
+        set_if_changed(text_data, 'font_bold_italic', fallback)
+    body_format = text_data.body_format
+    for index, character in enumerate(text_data.body):
+        if index >= len(body_format):
+            break
+        use_fallback = fallback is not None and character in missing
+        set_if_changed(body_format[index], 'use_bold', use_fallback)
+        set_if_changed(body_format[index], 'use_italic', use_fallback)
+
+
+def font_directories(settings):
+    #returns the list of folders set in the font folders setting
+    directories = settings.font_directories
+    return [bpy.path.abspath(directory.strip()) for directory in directories.split(';') if directory.strip()]
+
+
+def scan_fonts(settings, force=False):
+    #Indexes the fonts in the font folders, this is only done once unless the folders change or a rescan is forced
+    #settings should be the quicktitler settings of the scene being edited, not a title scene
+    directories = font_directories(settings)
+    if not force and font_registry['directories'] == directories:
+        return
+    fonts = {}
+    names = []
+    for directory in directories:
+        for root, folders, files in os.walk(directory):
+            for file in sorted(files):
+                if os.path.splitext(file)[1].lower() not in font_extensions:
+                    continue
+                filepath = os.path.join(root, file)
+                font_names = read_font_names(filepath)
+                if font_names is None:
+                    continue
+                family, style, full_name = font_names
+                if full_name.lower() not in fonts:
+                    names.append(full_name)
+                fonts.setdefault(full_name.lower(), filepath)
+                fonts.setdefault((family+' '+style).lower(), filepath)
+                if style.lower() in ['regular', 'normal', 'book', 'roman']:
+                    #a family name on its own finds the regular style
+                    fonts[family.lower()] = filepath
+                else:
+                    fonts.setdefault(family.lower(), filepath)
+                fonts.setdefault(os.path.splitext(file)[0].lower(), filepath)
+    font_registry['directories'] = directories
+    font_registry['fonts'] = fonts
+    font_registry['names'] = sorted(names, key=lambda name: name.lower())
+
+
+def loaded_font(filepath):
+    #returns a font datablock that was loaded from the given file, or None
+    filepath = os.path.normcase(os.path.abspath(filepath))
+    for font in bpy.data.fonts:
+        if font.filepath != '<builtin>' and os.path.normcase(os.path.abspath(bpy.path.abspath(font.filepath))) == filepath:
+            return font
+    return None
+
+
+def find_font(name, settings):
+    #Returns the font datablock for a font name used in a preset.
+    #Loaded fonts are used if they match, otherwise the name is looked up in the font folders by full name, family and style, or family, and loaded once.
+    if name in bpy.data.fonts:
+        return bpy.data.fonts[name]
+    scan_fonts(settings)
+    filepath = font_registry['fonts'].get(name.lower())
+    if not filepath:
+        return None
+    font = loaded_font(filepath)
+    if font is None:
+        try:
+            font = bpy.data.fonts.load(filepath, check_existing=True)
+        except:
+            print('Unable to load font: '+filepath)
+            return None
+    return font
+
+
+def font_directories_update(self, context):
+    font_registry['directories'] = None
+    quicktitle_autoupdate_all()
+
+
 def istexture(image):
     #Function to check if a texture with a specific image exists
     for texture in bpy.data.textures:
@@ -1429,10 +2813,28 @@ def quicktitle_create(quicktitle=False):
     scene = bpy.context.scene
     if not quicktitle:
         quicktitle = scene.quicktitler.current_quicktitle
+    title_scene = create_title_scene(quicktitle, scene.quicktitler.render_profile)
+
+    #Add scene to sequencer
+    bpy.ops.sequencer.scene_strip_add(frame_start=scene.frame_current, scene=title_scene.name)
+    sequence = bpy.context.scene.sequence_editor.active_strip
+    sequence.name = title_scene.name
+    sequence.blend_type = 'ALPHA_OVER'
+
+
+def title_object_add(title_scene, name, data=None, location=(0, 0, 0)):
+    #Creates an object and links it to a title scene
+    new_object = bpy.data.objects.new(name, data)
+    new_object.location = location
+    title_scene.collection.objects.link(new_object)
+    return new_object
+
+
+def create_title_scene(quicktitle, render_profile='FINAL'):
+    #Creates and returns a QuickTitle scene with the camera and lamps, does not need a window so it can be used when running in the background
 
     #Basic scene setup
-    bpy.ops.scene.new(type='EMPTY')
-    title_scene = bpy.context.scene
+    title_scene = bpy.data.scenes.new('QuickTitle')
     title_scene.frame_start = 1
     title_scene.frame_end = int(quicktitle.length)
     title_scene.render.film_transparent = True
@@ -1445,10 +2847,7 @@ def quicktitle_create(quicktitle=False):
     except:
         title_scene.render.engine = 'BLENDER_EEVEE'
     title_scene.eevee.use_shadows = True
-    title_scene.eevee.use_raytracing = True
-    title_scene.eevee.shadow_ray_count = 4
-    title_scene.eevee.shadow_step_count = 4
-    title_scene.eevee.taa_render_samples = 32
+    apply_render_profile(title_scene, render_profile)
 
     copy_title_preset(quicktitle, title_scene.quicktitler.current_quicktitle)
     quicktitle_preset = title_scene.quicktitler.current_quicktitle
@@ -1458,64 +2857,35 @@ def quicktitle_create(quicktitle=False):
         name = "QuickTitle"
     title_scene.name = name
 
-    bpy.ops.object.empty_add(type='PLAIN_AXES', location=(0, 0, 0))
-    lampcenter = bpy.context.active_object
-    basename = 'QuickTitlerLampCenter'
-    if basename in bpy.data.objects:
-        name = 'QuickTitlerLampCenter.001'
-        index = 1
-        while name in bpy.data.objects:
-            index = index+1
-            name = basename+str(index).zfill(3)
-    else:
-        name = basename
-    lampcenter.name = name
+    lampcenter = title_object_add(title_scene, 'QuickTitlerLampCenter')
     quicktitle_preset.lampcenter_internal_name = lampcenter.name
 
     #Camera setup
-    bpy.ops.object.camera_add()
-    camera = bpy.context.active_object
+    camera = title_object_add(title_scene, "QuickTitlerCamera", bpy.data.cameras.new("QuickTitlerCamera"), location=(0, 0, 2.17))
     title_scene.camera = camera
-    camera.location = (0, 0, 2.17)
-    camera.name = "QuickTitlerCamera"
     camera.data.lens = 39.2
 
     #Basic lamps setup
     lamp_energy = 50
-    bpy.ops.object.light_add(location=(-1.1, -.6, .5))
-    lamp1 = bpy.context.active_object
+    lamp1 = title_object_add(title_scene, 'Point', bpy.data.lights.new('Point', 'POINT'), location=(-1.1, -.6, .5))
     lamp1.data.energy = lamp_energy
     lamp1.data.use_shadow = False
     lamp1.parent = lampcenter
-    bpy.ops.object.light_add(location=(1.1, -.6, .5))
-    lamp2 = bpy.context.active_object
+    lamp2 = title_object_add(title_scene, 'Point', bpy.data.lights.new('Point', 'POINT'), location=(1.1, -.6, .5))
     lamp2.data.energy = lamp_energy
     lamp2.data.use_shadow = False
     lamp2.parent = lampcenter
-    bpy.ops.object.light_add(location=(-1.1, .6, .5))
-    lamp3 = bpy.context.active_object
+    lamp3 = title_object_add(title_scene, 'Point', bpy.data.lights.new('Point', 'POINT'), location=(-1.1, .6, .5))
     lamp3.data.energy = lamp_energy
     lamp3.data.use_shadow = False
     lamp3.parent = lampcenter
-    bpy.ops.object.light_add(location=(1.1, .6, .5))
-    lamp4 = bpy.context.active_object
+    lamp4 = title_object_add(title_scene, 'Point', bpy.data.lights.new('Point', 'POINT'), location=(1.1, .6, .5))
     lamp4.data.energy = lamp_energy
     lamp4.data.use_shadow = False
     lamp4.parent = lampcenter
 
     #Shadow lamp setup
-    bpy.ops.object.light_add(type='SPOT', location=(0, 0, 1))
-    shadow_lamp = bpy.context.active_object
-    basename = 'QuickTitlerLamp'
-    if basename in bpy.data.objects:
-        name = 'QuickTitlerLamp.001'
-        index = 1
-        while name in bpy.data.objects:
-            index = index+1
-            name = basename+str(index).zfill(3)
-    else:
-        name = basename
-    shadow_lamp.name = name
+    shadow_lamp = title_object_add(title_scene, 'QuickTitlerLamp', bpy.data.lights.new('QuickTitlerLamp', 'SPOT'), location=(0, 0, 1))
     quicktitle_preset.shadowlamp_internal_name = shadow_lamp.name
     #shadow_lamp.parent = lampcenter
     shadow_lamp.data.specular_factor = 0
@@ -1523,31 +2893,14 @@ def quicktitle_create(quicktitle=False):
     shadow_lamp.data.use_shadow = True
     shadow_lamp.data.spot_size = 2.6
 
-    bpy.ops.object.light_add(type='SPOT', location=(0, 0, 1))
-    shadow_lamp = bpy.context.active_object
-    basename = 'QuickTitlerLampInverse'
-    if basename in bpy.data.objects:
-        name = 'QuickTitlerLampInverse.001'
-        index = 1
-        while name in bpy.data.objects:
-            index = index+1
-            name = basename+str(index).zfill(3)
-    else:
-        name = basename
-    shadow_lamp.name = name
+    shadow_lamp = title_object_add(title_scene, 'QuickTitlerLampInverse', bpy.data.lights.new('QuickTitlerLampInverse', 'SPOT'), location=(0, 0, 1))
     quicktitle_preset.shadowlamp_inverse_internal_name = shadow_lamp.name
     #shadow_lamp.parent = lampcenter
     shadow_lamp.data.specular_factor = 0
     shadow_lamp.data.shadow_soft_size = 0
     shadow_lamp.data.use_shadow = False
     shadow_lamp.data.spot_size = 2.6
-
-    #Add scene to sequencer
-    bpy.context.window.scene = scene
-    bpy.ops.sequencer.scene_strip_add(frame_start=scene.frame_current, scene=title_scene.name)
-    sequence = bpy.context.scene.sequence_editor.active_strip
-    sequence.name = name
-    sequence.blend_type = 'ALPHA_OVER'
+    return title_scene
 
 
 def create_object(scene, object_type, name):
@@ -1618,12 +2971,91 @@ def create_object(scene, object_type, name):
     return title_object
 
 
-def set_animations(title_object, object_preset, material, scene, z_offset, pos_multiplier, shaders, parent=None):
+def animation_points(animation_preset, start_frame, end_frame, in_value, value, out_value):
+    #returns the keyframe points for an animation preset, given the values at the start, middle and end of the animation
+    points = []
+    if animation_preset.animate_in:
+        points.append((start_frame + animation_preset.in_offset, in_value))
+        points.append((start_frame + animation_preset.in_offset + animation_preset.in_length, value))
+    else:
+        points.append((start_frame, value))
+    if animation_preset.animate_out:
+        points.append((end_frame + animation_preset.out_offset - animation_preset.out_length, value))
+        points.append((end_frame + animation_preset.out_offset, out_value))
+    else:
+        points.append((end_frame, value))
+    return points
+
+
+def set_fcurve_animation(fcurve, animation_preset, points, start_frame, end_frame):
+    #replaces the keyframes on a fcurve with the given points, and sets up the cyclic modifier of the animation preset
+    clear_keyframes(fcurve)
+    for index, point in enumerate(points):
+        fcurve.keyframe_points.add(count=1)
+        fcurve.keyframe_points[index].co = point
+    update_profiler.count('keyframes written', len(points))
+
+    #Set cyclic animations
+    if animation_preset.cycle_type != 'NONE':
+        cycle_type = animation_preset.cycle_type
+        x_scale = animation_preset.cycle_x_scale
+        y_scale = animation_preset.cycle_y_scale
+        offset = animation_preset.cycle_offset
+        if len(fcurve.modifiers) > 0:
+            for modifier in reversed(fcurve.modifiers):
+                fcurve.modifiers.remove(modifier)
+        if cycle_type == 'RANDOM':
+            modifier = fcurve.modifiers.new(type='NOISE')
+            modifier.scale = x_scale * 10
+            modifier.strength = y_scale
+            modifier.offset = offset
+        elif cycle_type == 'SINE':
+            modifier = fcurve.modifiers.new(type='FNGENERATOR')
+            modifier.function_type = 'SIN'
+            modifier.use_additive = True
+            modifier.amplitude = y_scale / 4
+            if x_scale > 0:
+                modifier.phase_multiplier = 1 / x_scale / 10
+            else:
+                modifier.phase_multiplier = 0
+            modifier.phase_offset = -offset
+        elif cycle_type == 'TANGENT':
+            modifier = fcurve.modifiers.new(type='FNGENERATOR')
+            modifier.function_type = 'TAN'
+            modifier.use_additive = True
+            modifier.amplitude = y_scale / 20
+            if x_scale > 0:
+                modifier.phase_multiplier = 1 / x_scale / 10
+            else:
+                modifier.phase_multiplier = 0
+            modifier.phase_offset = -offset
+        else:
+            modifier = None
+        if modifier:
+            modifier.use_restricted_range = True
+            if animation_preset.animate_in:
+                modifier.frame_start = start_frame + animation_preset.in_offset
+                modifier.blend_in = animation_preset.in_length
+            else:
+                modifier.frame_start = start_frame
+                modifier.blend_in = 0
+            if animation_preset.animate_out:
+                modifier.frame_end = end_frame + animation_preset.out_offset
+                modifier.blend_out = animation_preset.out_length
+            else:
+                modifier.frame_end = end_frame
+                modifier.blend_out = 0
+    fcurve.update()
+
+
+def set_animations(title_object, object_preset, material, scene, z_offset, pos_multiplier, shaders, parent=None, animation_presets=None):
     #look for and clear animations that are no longer set
+    if animation_presets is None:
+        animation_presets = object_preset.animations
 
     #clear old animations
     animation_types = []
-    for animation in object_preset.animations:
+    for animation in animation_presets:
         animation_types.append(animation.variable)
     if material:
         transparency_factor = shaders.transparency_factor
@@ -1674,7 +3106,7 @@ def set_animations(title_object, object_preset, material, scene, z_offset, pos_m
     #if animations are on this object, update them
     start_frame = scene.frame_start
     end_frame = scene.frame_end
-    for animation_preset in object_preset.animations:
+    for animation_preset in animation_presets:
         if animation_preset.variable == 'Alpha':
             if not material:
                 continue
@@ -1718,76 +3150,13 @@ def set_animations(title_object, object_preset, material, scene, z_offset, pos_m
         if variable == 'Width' or variable == 'Height' or variable == 'Depth':
             offsetvalue = 0
         if fcurve:
-            points = []
-            if animation_preset.animate_in:
-                points.append((start_frame + animation_preset.in_offset, (offsetvalue + in_amount) * scalevalue))
-                points.append((start_frame + animation_preset.in_offset + animation_preset.in_length, value))
-            else:
-                points.append((start_frame, value))
-            if animation_preset.animate_out:
-                points.append((end_frame + animation_preset.out_offset - animation_preset.out_length, value))
-                points.append((end_frame + animation_preset.out_offset, (offsetvalue + out_amount) * scalevalue))
-            else:
-                points.append((end_frame, value))
-            clear_keyframes(fcurve)
-            for index, point in enumerate(points):
-                fcurve.keyframe_points.add(count=1)
-                fcurve.keyframe_points[index].co = point
-
-            #Set cyclic animations
-            if animation_preset.cycle_type != 'NONE':
-                cycle_type = animation_preset.cycle_type
-                x_scale = animation_preset.cycle_x_scale
-                y_scale = animation_preset.cycle_y_scale
-                offset = animation_preset.cycle_offset
-                if len(fcurve.modifiers) > 0:
-                    for modifier in reversed(fcurve.modifiers):
-                        fcurve.modifiers.remove(modifier)
-                if cycle_type == 'RANDOM':
-                    modifier = fcurve.modifiers.new(type='NOISE')
-                    modifier.scale = x_scale * 10
-                    modifier.strength = y_scale
-                    modifier.offset = offset
-                elif cycle_type == 'SINE':
-                    modifier = fcurve.modifiers.new(type='FNGENERATOR')
-                    modifier.function_type = 'SIN'
-                    modifier.use_additive = True
-                    modifier.amplitude = y_scale / 4
-                    if x_scale > 0:
-                        modifier.phase_multiplier = 1 / x_scale / 10
-                    else:
-                        modifier.phase_multiplier = 0
-                    modifier.phase_offset = -offset
-                elif cycle_type == 'TANGENT':
-                    modifier = fcurve.modifiers.new(type='FNGENERATOR')
-                    modifier.function_type = 'TAN'
-                    modifier.use_additive = True
-                    modifier.amplitude = y_scale / 20
-                    if x_scale > 0:
-                        modifier.phase_multiplier = 1 / x_scale / 10
-                    else:
-                        modifier.phase_multiplier = 0
-                    modifier.phase_offset = -offset
-                else:
-                    modifier = None
-                if modifier:
-                    modifier.use_restricted_range = True
-                    if animation_preset.animate_in:
-                        modifier.frame_start = start_frame + animation_preset.in_offset
-                        modifier.blend_in = animation_preset.in_length
-                    else:
-                        modifier.frame_start = start_frame
-                        modifier.blend_in = 0
-                    if animation_preset.animate_out:
-                        modifier.frame_end = end_frame + animation_preset.out_offset
-                        modifier.blend_out = animation_preset.out_length
-                    else:
-                        modifier.frame_end = end_frame
-                        modifier.blend_out = 0
-            fcurve.update()
+            in_value = (offsetvalue + in_amount) * scalevalue
+            out_value = (offsetvalue + out_amount) * scalevalue
+            points = animation_points(animation_preset, start_frame, end_frame, in_value, value, out_value)
+            set_fcurve_animation(fcurve, animation_preset, points, start_frame, end_frame)
 
 
-def setup_object(title_object, object_preset, scale_multiplier):
+def setup_object(title_object, object_preset, scale_multiplier, settings):
     #settings for different title_object types
     shear = object_preset.shear
     if object_preset.type == 'IMAGE':
@@ -1818,9 +3187,9 @@ def setup_object(title_object, object_preset, scale_multiplier):
 
     if object_preset.type in ['CIRCLE', 'BOX', 'TEXT']:
         #set up the circle, box and text settings
-        title_object.data.extrude = object_preset.extrude / 10.0
-        title_object.data.bevel_depth = object_preset.bevel / 10.0
-        title_object.data.bevel_resolution = object_preset.bevel_resolution
+        #writing any of these makes blender rebuild the whole curve, so they are only set when they change
+        set_if_changed(title_object.data, 'extrude', object_preset.extrude / 10.0)
+        set_if_changed(title_object.data, 'bevel_depth', object_preset.bevel / 10.0)
 
     if object_preset.type == 'BOX':
         #set up the box settings
@@ -1843,22 +3212,364 @@ def setup_object(title_object, object_preset, scale_multiplier):
 
     if object_preset.type == 'TEXT':
         #set up the text settings
-        text_formatted = object_preset.text.encode().decode('unicode_escape').encode('latin1').decode('utf-8')
-        title_object.data.body = text_formatted
-        title_object.data.align_x = object_preset.align
-        title_object.data.shear = object_preset.shear
-        if object_preset.font in bpy.data.fonts:
-            title_object.data.font = bpy.data.fonts[object_preset.font]
+        set_if_changed(title_object.data, 'body', format_text(object_preset.text))
+        set_if_changed(title_object.data, 'align_x', object_preset.align)
+        set_if_changed(title_object.data, 'shear', object_preset.shear)
+        font = find_font(object_preset.font, settings)
+        if font:
+            set_if_changed(title_object.data, 'font', font)
+
+        #check that the font can show all the characters
+        missing = missing_characters(title_object.data.font, title_object.data.body)
+        set_if_changed(object_preset, 'missing_glyphs', missing)
+        fallback = None
+        if missing and settings.use_fallback_font and settings.fallback_font:
+            fallback = find_font(settings.fallback_font, settings)
+        set_fallback_font(title_object.data, missing, fallback)
+        text_box = title_object.data.text_boxes[0]
         if object_preset.word_wrap:
             x_scale = title_object.scale[0]
             if x_scale == 0:
                 x_scale = 0.001
             box_size = (1.0/x_scale)*scale_multiplier*2
-            title_object.data.text_boxes[0].width = box_size * object_preset.wrap_width
-            title_object.data.text_boxes[0].x = -(box_size / 2) * object_preset.wrap_width
+            set_if_changed(text_box, 'width', box_size * object_preset.wrap_width)
+            set_if_changed(text_box, 'x', -(box_size / 2) * object_preset.wrap_width)
+        else:
+            set_if_changed(text_box, 'width', 0)
+            set_if_changed(text_box, 'x', 0)
+
+
+def set_if_changed(data, attribute, value, tolerance=0.000001):
+    #sets an attribute only if it is different from the value, floats within the tolerance are treated as the same
+    #returns True if the value was written
+    old_value = getattr(data, attribute)
+    if isinstance(value, float) or isinstance(old_value, float):
+        if abs(old_value - value) <= tolerance:
+            return False
+    elif old_value == value:
+        return False
+    setattr(data, attribute, value)
+    return True
+
+
+@lru_cache(maxsize=256)
+def format_text(text):
+    #converts escaped characters such as '\n' in a text preset to the characters they represent
+    return text.encode().decode('unicode_escape').encode('latin1').decode('utf-8')
+
+
+def use_glyphs(object_preset):
+    #returns True if this object preset should be split into individually animated characters
+    return object_preset.type == 'TEXT' and object_preset.glyph_mode != 'NONE'
+
+
+def get_glyphs(title_object):
+    #returns the glyph instance objects of a text object, in text order
+    glyphs = [child for child in title_object.children if 'quicktitle_glyph_index' in child]
+    glyphs.sort(key=lambda glyph: glyph['quicktitle_glyph_index'])
+    return glyphs
+
+
+def remove_glyphs(title_object):
+    #deletes the glyph instances and the shared glyph animation of a text object
+    for glyph in get_glyphs(title_object):
+        bpy.data.objects.remove(glyph, do_unlink=True)
+    action_name = title_object.name+' Glyphs'
+    if action_name in bpy.data.actions:
+        bpy.data.actions.remove(bpy.data.actions[action_name])
+    clean_glyph_meshes()
+
+
+def clean_glyph_meshes():
+    #removes cached glyph meshes that are no longer used by any glyph instance
+    for key, mesh_name in list(glyph_meshes.items()):
+        mesh = bpy.data.meshes.get(mesh_name)
+        if mesh is None or mesh.get('quicktitle_glyph') != repr(key):
+            del glyph_meshes[key]
+        elif mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+            del glyph_meshes[key]
+
+
+def glyph_geometry_key(text_data, character):
+    #returns the key used to share a glyph mesh between all characters that look the same
+    font = text_data.font
+    font_key = (font.name, font.filepath) if font else ('', '')
+    fallback = text_data.font_bold_italic
+    fallback_key = (fallback.name, fallback.filepath) if fallback else ('', '')
+    return (font_key, fallback_key, character, round(text_data.size, 6), round(text_data.extrude, 6), round(text_data.bevel_depth, 6), text_data.bevel_resolution, round(text_data.shear, 6), text_data.resolution_u)
+
+
+def glyph_spacing_key(text_data):
+    #returns the key used to cache character advances and line heights for a font
+    font = text_data.font
+    font_key = (font.name, font.filepath) if font else ('', '')
+    return (font_key, round(text_data.size, 6), round(text_data.space_character, 6), round(text_data.space_line, 6))
+
+
+def ensure_glyphs(scene, text_data, characters):
+    #Makes sure a shared mesh and an advance width are cached for all the given characters.
+    #All missing characters are measured with temporary text objects in a single depsgraph update, so each glyph is only ever built once.
+    spacing_key = glyph_spacing_key(text_data)
+    advances = glyph_advances.setdefault(spacing_key, {})
+    missing = [index for index, char_format in enumerate(text_data.body_format) if char_format.use_bold and char_format.use_italic]
+    missing = set(text_data.body[index] for index in missing if index < len(text_data.body))
+    temporary = []
+    mesh_objects = {}
+    advance_objects = {}
+
+    def add_temporary(body):
+        curve = text_data.copy()
+        curve.body = body
+        for index, character in enumerate(body):
+            if index < len(curve.body_format):
+                use_fallback = character in missing
+                curve.body_format[index].use_bold = use_fallback
+                curve.body_format[index].use_italic = use_fallback
+        curve.align_x = 'LEFT'
+        curve.text_boxes[0].width = 0
+        curve.text_boxes[0].x = 0
+        temporary_object = bpy.data.objects.new('QuickTitler Glyph Measure', curve)
+        scene.collection.objects.link(temporary_object)
+        temporary.append(temporary_object)
+        return temporary_object
+
+    for character in characters:
+        if not character.isspace():
+            key = glyph_geometry_key(text_data, character)
+            mesh_name = glyph_meshes.get(key, '')
+            if mesh_name not in bpy.data.meshes or bpy.data.meshes[mesh_name].get('quicktitle_glyph') != repr(key):
+                mesh_objects[character] = add_temporary(character)
+        if character not in advances:
+            #the advance of a character is how much it pushes the following character to the right
+            advance_objects[character] = add_temporary(character+'l')
+    line_object = None
+    if advance_objects:
+        reference_object = add_temporary('l')
+        if spacing_key not in glyph_line_heights:
+            line_object = add_temporary('l\nl')
+    if not temporary:
+        return
+
+    depsgraph = scene.view_layers[0].depsgraph
+    depsgraph.update()
+    update_profiler.count('depsgraph updates')
+    if advance_objects:
+        reference_bounds = reference_object.evaluated_get(depsgraph).bound_box
+        reference_right = max(corner[0] for corner in reference_bounds)
+        for character, advance_object in advance_objects.items():
+            right = max(corner[0] for corner in advance_object.evaluated_get(depsgraph).bound_box)
+            advances[character] = right - reference_right
+        if line_object:
+            reference_bottom = min(corner[1] for corner in reference_bounds)
+            bottom = min(corner[1] for corner in line_object.evaluated_get(depsgraph).bound_box)
+            glyph_line_heights[spacing_key] = reference_bottom - bottom
+    for character, mesh_object in mesh_objects.items():
+        key = glyph_geometry_key(text_data, character)
+        mesh = bpy.data.meshes.new_from_object(mesh_object.evaluated_get(depsgraph))
+        mesh.name = 'QuickTitler Glyph '+character
+        mesh['quicktitle_glyph'] = repr(key)
+        glyph_meshes[key] = mesh.name
+
+    for temporary_object in temporary:
+        curve = temporary_object.data
+        bpy.data.objects.remove(temporary_object, do_unlink=True)
+        bpy.data.curves.remove(curve)
+
+
+def glyph_layout(text_data, body, advances, line_height, glyph_mode):
+    #Lays out the characters of a text body the same way Blender does, returning (character, x, y, unit) for each visible character.
+    #The unit is the index of the character or word, used to stagger the animations.
+    box = text_data.text_boxes[0]
+    box_width = box.width
+
+    def text_width(text):
+        return sum(advances.get(character, 0) for character in text)
+
+    #split into lines, word wrapping if a text box is set
+    lines = []
+    for paragraph in body.split('\n'):
+        if box_width <= 0:
+            lines.append(paragraph)
+            continue
+        line = ''
+        for word in paragraph.split(' '):
+            test_line = line+' '+word if line else word
+            if line and text_width(test_line) > box_width:
+                lines.append(line)
+                line = word
+            else:
+                line = test_line
+        lines.append(line)
+
+    layout = []
+    character_index = 0
+    word_index = -1
+    in_word = False
+    for line_index, line in enumerate(lines):
+        width = text_width(line.rstrip())
+        if text_data.align_x == 'CENTER':
+            x = (box.x + (box_width - width) / 2) if box_width > 0 else -width / 2
+        elif text_data.align_x == 'RIGHT':
+            x = (box.x + box_width - width) if box_width > 0 else -width
+        else:
+            x = box.x if box_width > 0 else 0
+        y = box.y - (line_index * line_height)
+        in_word = False
+        for character in line:
+            if character.isspace():
+                in_word = False
+            else:
+                if not in_word:
+                    word_index = word_index + 1
+                    in_word = True
+                if glyph_mode == 'WORD':
+                    unit = word_index
+                else:
+                    unit = character_index
+                layout.append((character, x, y, unit))
+                character_index = character_index + 1
+            x = x + advances.get(character, 0)
+    return layout
+
+
+def set_glyph_animations(action, object_preset, title_object, scene, end_frame, z_offset, pos_multiplier):
+    #Builds the single action shared by all glyphs of a text object.  Animations are applied to the delta transforms so the glyphs keep their own positions.
+    fcurves = ensure_action_fcurves(action)
+    for fcurve in reversed(list(fcurves)):
+        fcurves.remove(fcurve)
+
+    def ensure_fcurve(data_path, index=0):
+        return fcurves.find(data_path, index=index) or fcurves.new(data_path, index=index)
+
+    start_frame = scene.frame_start
+    alpha = object_preset.alpha
+    scalevalue = 1 + (z_offset * .457)
+    for animation_preset in object_preset.animations:
+        variable = animation_preset.variable
+        in_amount = animation_preset.in_amount
+        out_amount = animation_preset.out_amount
+        value = 0
+        if variable == 'Alpha':
+            fcurve = ensure_fcurve('["quicktitle_alpha"]')
+            value = 1
+            in_value = in_amount / alpha if alpha else 0
+            out_value = out_amount / alpha if alpha else 0
+        elif 'Slide' in variable:
+            axis = ['X Slide', 'Y Slide', 'Z Slide'].index(variable)
+            fcurve = ensure_fcurve('delta_location', index=axis)
+            location = title_object.location[axis]
+            axis_scale = title_object.scale[axis] if title_object.scale[axis] else 1
+            in_value = ((location / pos_multiplier + in_amount) * scalevalue - location) / axis_scale
+            out_value = ((location / pos_multiplier + out_amount) * scalevalue - location) / axis_scale
+        elif 'Rotate' in variable:
+            axis = ['X Rotate', 'Y Rotate', 'Z Rotate'].index(variable)
+            fcurve = ensure_fcurve('delta_rotation_euler', index=axis)
+            in_value = in_amount / 180 * pi
+            out_value = out_amount / 180 * pi
+        elif variable in ['Width', 'Height', 'Depth']:
+            axis = ['Width', 'Height', 'Depth'].index(variable)
+            fcurve = ensure_fcurve('delta_scale', index=axis)
+            value = 1
+            axis_scale = title_object.scale[axis] if title_object.scale[axis] else 1
+            in_value = in_amount / axis_scale
+            out_value = out_amount / axis_scale
+        else:
+            continue
+        points = animation_points(animation_preset, start_frame, end_frame, in_value, value, out_value)
+        set_fcurve_animation(fcurve, animation_preset, points, start_frame, end_frame)
+
+
+def update_glyphs(scene, title_object, object_preset, z_offset, pos_multiplier):
+    #Splits a text object into one object per character, each instancing a mesh shared by every identical character.
+    #All glyphs share one material and one action, the action is offset in time for each glyph by a NLA strip to stagger the animation.
+    if not use_glyphs(object_preset):
+        if 'quicktitle_glyphs' in title_object:
+            remove_glyphs(title_object)
+            del title_object['quicktitle_glyphs']
+            title_object.visible_camera = True
+            title_object.visible_shadow = True
+        return
+
+    #the original text object stays in the scene for bounds and selecting, but is hidden from renders
+    title_object['quicktitle_glyphs'] = True
+    title_object['quicktitle_alpha'] = 1.0
+    title_object.visible_camera = False
+    title_object.visible_shadow = False
+
+    text_data = title_object.data
+    body = text_data.body
+    ensure_glyphs(scene, text_data, set(body))
+    spacing_key = glyph_spacing_key(text_data)
+    advances = glyph_advances.get(spacing_key, {})
+    line_height = glyph_line_heights.get(spacing_key, text_data.size * text_data.space_line)
+    layout = glyph_layout(text_data, body, advances, line_height, object_preset.glyph_mode)
+
+    units = (max(glyph[3] for glyph in layout) + 1) if layout else 0
+    stagger = object_preset.glyph_stagger
+    #the out animations end earlier so the last glyph finishes its animation at the end of the title
+    end_frame = scene.frame_end - (max(units - 1, 0) * stagger)
+
+    material = get_material(title_object)
+    glyphs = get_glyphs(title_object)
+    for index, glyph_info in enumerate(layout):
+        character, x, y, unit = glyph_info
+        mesh = bpy.data.meshes.get(glyph_meshes.get(glyph_geometry_key(text_data, character), ''))
+        if mesh is None:
+            continue
+        if index < len(glyphs):
+            glyph = glyphs[index]
+            if glyph.data != mesh:
+                glyph.data = mesh
         else:
-            title_object.data.text_boxes[0].width = 0
-            title_object.data.text_boxes[0].x = 0
+            glyph = bpy.data.objects.new(title_object.name+' Glyph', mesh)
+            scene.collection.objects.link(glyph)
+            glyph.parent = title_object
+            glyph['quicktitle_glyph_index'] = index
+            glyph['quicktitle_alpha'] = 1.0
+            glyph.animation_data_create()
+            glyphs.append(glyph)
+        if tuple(glyph.location) != (x, y, 0):
+            glyph.location = (x, y, 0)
+        if get_material(glyph) != material:
+            set_material(glyph, material)
+        glyph.hide_viewport = not object_preset.visible
+        glyph.hide_render = not object_preset.visible
+        if object_preset.glyph_reverse:
+            unit = units - 1 - unit
+        glyph['quicktitle_glyph_unit'] = unit
+
+    #remove glyphs left over from a longer text
+    for glyph in glyphs[len(layout):]:
+        bpy.data.objects.remove(glyph, do_unlink=True)
+    glyphs = glyphs[:len(layout)]
+    if not glyphs:
+        clean_glyph_meshes()
+        return
+
+    action_name = title_object.name+' Glyphs'
+    if action_name in bpy.data.actions:
+        action = bpy.data.actions[action_name]
+    else:
+        action = bpy.data.actions.new(action_name)
+    set_glyph_animations(action, object_preset, title_object, scene, end_frame, z_offset, pos_multiplier)
+    action.use_frame_range = True
+    action.frame_start = scene.frame_start
+    action.frame_end = max(end_frame, scene.frame_start + 1)
+
+    for glyph in glyphs:
+        strip_start = scene.frame_start + (glyph['quicktitle_glyph_unit'] * stagger)
+        tracks = glyph.animation_data.nla_tracks
+        strip = tracks[0].strips[0] if len(tracks) == 1 and len(tracks[0].strips) == 1 else None
+        if strip and strip.action == action and strip.action_slot == action.slots[0] and strip.frame_start == strip_start and strip.action_frame_start == action.frame_start and strip.action_frame_end == action.frame_end:
+            continue
+        for track in reversed(list(tracks)):
+            tracks.remove(track)
+        track = tracks.new()
+        strip = track.strips.new('QuickTitle Glyph', int(strip_start), action)
+        strip.action_slot = action.slots[0]
+        strip.extrapolation = 'HOLD'
+    clean_glyph_meshes()
 
 
 def get_shaders(material, use_shadeless=False, mat_type=None):
@@ -1880,6 +3591,8 @@ def update_material(object_preset, material):
     shaders.update_shadowcasting(object_preset.cast_shadows)
     if object_preset.type == 'IMAGE':
         shaders.update_image(object_preset)
+    else:
+        shaders.update_instance_alpha(use_glyphs(object_preset))
     return shaders
 
 
@@ -1900,14 +3613,12 @@ def get_material(title_object):
 def quicktitle_update(sequence, quicktitle, update_all=False):
     #Function to update a QuickTitle sequence
     scene = sequence.scene
+    update_profiler.begin(scene.name)
+    remove_title_cache(sequence)
+    #the settings are read from the scene being edited, the title scene's own settings are never changed
+    settings = bpy.context.scene.quicktitler
     oldscene = bpy.context.window.scene
     bpy.context.window.scene = scene
-    scenename = "QuickTitle: "+quicktitle.name
-
-    #Update scene length, if changed, update all objects
-    if scene.frame_end != quicktitle.length:
-        scene.frame_end = int(quicktitle.length)
-        update_all = True
 
     #Fix sequence length if needed
     if sequence.frame_offset_start != 0:
@@ -1915,6 +3626,32 @@ def quicktitle_update(sequence, quicktitle, update_all=False):
         sequence.frame_offset_start = 0
     if sequence.frame_offset_end != 0:
         sequence.frame_offset_end = 0
+    update_profiler.mark('sequence')
+
+    update_title_scene(scene, quicktitle, settings, update_all)
+
+    #update sequence
+    sequence.name = scene.name
+    bpy.context.window.scene = oldscene
+    scene.update_tag()
+    update_profiler.count('depsgraph updates')
+    bpy.ops.sequencer.reload(adjust_length=True)
+    bpy.ops.sequencer.refresh_all()
+    update_profiler.mark('reload')
+    update_profiler.end()
+
+
+def update_title_scene(scene, quicktitle, settings, update_all=False):
+    #Function to update the objects in a QuickTitle scene
+    #settings are the quicktitler settings of the scene being edited, the title scene is the context scene while this runs
+    global title_revision
+    title_revision = title_revision + 1
+    scenename = "QuickTitle: "+quicktitle.name
+
+    #Update scene length, if changed, update all objects
+    if scene.frame_end != quicktitle.length:
+        scene.frame_end = int(quicktitle.length)
+        update_all = True
 
     #attempt to find and update the shadow lamp
     if quicktitle.shadowlamp_internal_name in scene.objects and quicktitle.shadowlamp_inverse_internal_name in scene.objects:
@@ -1945,6 +3682,7 @@ def quicktitle_update(sequence, quicktitle, update_all=False):
         lampcenter.rotation_euler[2] = -quicktitle.lightrot/180.0*pi
     else:
         print('Selected Title Scene Is Incomplete: missing Lamp Center')
+    update_profiler.mark('lamps')
 
     #update individual scene objects
     for object_layer, object_preset in enumerate(quicktitle.objects):
@@ -1995,6 +3733,7 @@ def quicktitle_update(sequence, quicktitle, update_all=False):
         scale_multiplier = (z_scale * (z_index * offset_multiplier)) + 1
         pos_multiplier = 1 + (z_scale * (z_index * offset_multiplier))
         z_offset = z_index * z_scale
+        update_profiler.mark('find_object', title_object.name)
 
         #detailed settings need to be updated for this object
         if selected_object or created_object or update_all:
@@ -2044,24 +3783,40 @@ def quicktitle_update(sequence, quicktitle, update_all=False):
                     set_material(title_object, material)
 
                 shaders = update_material(object_preset, material)
+            update_profiler.mark('material', title_object.name)
 
-            setup_object(title_object, object_preset, scale_multiplier)
+            setup_object(title_object, object_preset, scale_multiplier, settings)
+            update_profiler.mark('setup_object', title_object.name)
 
-            set_animations(title_object, object_preset, material, scene, z_offset, pos_multiplier, shaders)
+            if use_glyphs(object_preset):
+                #animations are applied to the individual glyphs instead of the text object
+                set_animations(title_object, object_preset, material, scene, z_offset, pos_multiplier, shaders, animation_presets=[])
+            else:
+                set_animations(title_object, object_preset, material, scene, z_offset, pos_multiplier, shaders)
+            update_profiler.mark('set_animations', title_object.name)
 
             update_bounds(title_object, object_preset, scene, scale_multiplier, pos_multiplier)
+            animated_bounds.pop(title_object.name, None)
+            update_profiler.mark('update_bounds', title_object.name)
+
+            update_curve_resolution(scene, quicktitle, object_layer, title_object, object_preset, scale_multiplier, settings)
+            update_profiler.mark('curve_resolution', title_object.name)
+
+            if object_preset.type == 'TEXT':
+                update_glyphs(scene, title_object, object_preset, z_offset, pos_multiplier)
+                update_profiler.mark('glyphs', title_object.name)
 
             outline_object_name = title_object.name+'outline'
             outline_object = None
             if outline_object_name in scene.objects:
                 outline_object = scene.objects[outline_object_name]
-                if not object_preset.outline:
+                if not object_preset.outline or use_glyphs(object_preset):
                     #delete outline object
                     scene.collection.objects.unlink(outline_object)
                     bpy.data.objects.remove(outline_object, do_unlink=True)
                     outline_object = None
             else:
-                if object_preset.outline:
+                if object_preset.outline and not use_glyphs(object_preset):
                     #create outline object
                     outline_object = create_object(scene, object_preset.type, outline_object_name)
 
@@ -2075,9 +3830,9 @@ def quicktitle_update(sequence, quicktitle, update_all=False):
                 material.blend_method = 'BLEND'
                 material.diffuse_color = [object_preset.outline_diffuse_color[0], object_preset.outline_diffuse_color[1], object_preset.outline_diffuse_color[2], object_preset.outline_alpha]
                 shaders = get_shaders(material, use_shadeless=True)
-                shaders.transparency_factor.inputs[1].default_value = object_preset.outline_alpha
-                shaders.shader.inputs['Color'].default_value[:3] = object_preset.outline_diffuse_color
-                shaders.shader.inputs['Strength'].default_value = 1
+                shaders.set_node_input(shaders.transparency_factor, 1, object_preset.outline_alpha)
+                shaders.set_node_color(shaders.shader, 'Color', object_preset.outline_diffuse_color)
+                shaders.set_node_input(shaders.shader, 'Strength', 1)
                 shaders.update_shadowcasting(object_preset.cast_shadows)
 
                 #adjust object
@@ -2090,21 +3845,19 @@ def quicktitle_update(sequence, quicktitle, update_all=False):
                 outline_object.location = (pos_multiplier * object_preset.x, pos_multiplier * object_preset.y, object_preset.z - z_offset - .001)
                 outline_object.scale = (scale_multiplier * object_preset.scale * object_preset.width, scale_multiplier * object_preset.scale * object_preset.height, object_preset.scale)
                 outline_object.rotation_euler = (object_preset.rot_x / 180.0 * pi, object_preset.rot_y / 180.0 * pi, -object_preset.rot_z / 180.0 * pi)
-                setup_object(outline_object, object_preset, scale_multiplier)
+                setup_object(outline_object, object_preset, scale_multiplier, settings)
+                set_if_changed(outline_object.data, 'resolution_u', title_object.data.resolution_u)
+                set_if_changed(outline_object.data, 'bevel_resolution', title_object.data.bevel_resolution)
                 set_animations(outline_object, object_preset, material, scene, z_offset, pos_multiplier, shaders, parent=title_object)
                 #outline_object.data.offset = object_preset.outline_size / 100
                 outline_object.data.extrude = 0
                 outline_object.data.bevel_depth = object_preset.outline_size / 100
                 outline_object.scale[2] = 0
                 outline_object.data.fill_mode = 'FRONT'
+            update_profiler.mark('outline', title_object.name)
 
-    #update scene and sequence
+    #update scene
     scene.name = scenename
-    sequence.name = scenename
-    bpy.context.window.scene = oldscene
-    scene.update_tag()
-    bpy.ops.sequencer.reload(adjust_length=True)
-    bpy.ops.sequencer.refresh_all()
 
 
 def get_fcurve(action, variable, shaders, material=None, data_object=None, on_object=None):
@@ -2170,6 +3923,7 @@ def get_fcurve(action, variable, shaders, material=None, data_object=None, on_ob
 def clear_keyframes(fcurve):
     #Removes all points on a curve
     index = len(fcurve.keyframe_points) - 1
+    update_profiler.count('keyframes removed', index + 1)
     while index >= 0:
         fcurve.keyframe_points.remove(fcurve.keyframe_points[index], fast=True)
         index = index-1
@@ -2489,6 +4243,23 @@ class QuickTitleObject(bpy.types.PropertyGroup):
         default='CENTER',
         description="Determines the position of the text within the wrapping box.",
         update=quicktitle_autoupdate)
+    glyph_mode: bpy.props.EnumProperty(
+        name="Animate By",
+        items=[('NONE', 'Whole Text', '', 1), ('CHARACTER', 'Character', '', 2), ('WORD', 'Word', '', 3)],
+        default='NONE',
+        description="Apply this object's animations to each character or word separately, instead of to the whole text.  Outlines are not available in this mode.",
+        update=quicktitle_autoupdate)
+    glyph_stagger: bpy.props.IntProperty(
+        name="Stagger",
+        default=2,
+        min=0,
+        description="Number of frames between the animation of each character or word.",
+        update=quicktitle_autoupdate)
+    glyph_reverse: bpy.props.BoolProperty(
+        name="Reverse Order",
+        default=False,
+        description="Animate the characters or words from last to first.",
+        update=quicktitle_autoupdate)
 
     #Variables specific to all but Image type:
     outline: bpy.props.BoolProperty(
@@ -2565,6 +4336,9 @@ class QuickTitleObject(bpy.types.PropertyGroup):
         name="Bounding Box Top")
     bbbottom: bpy.props.FloatProperty(
         name="Bounding Box Bottom")
+    missing_glyphs: bpy.props.StringProperty(
+        name="Missing Characters",
+        description="Characters in the text that the font can not display")
 
 
 class QuickTitle(bpy.types.PropertyGroup):
@@ -2705,6 +4479,7 @@ class QUICKTITLING_PT_Panel(bpy.types.Panel):
             row.menu('QUICKTITLING_MT_preset_menu', text=quicktitle_preset.name)
             row = box.row()
             row.operator('quicktitler.preset_import', text='Import Preset')
+            row.operator('quicktitler.preset_thumbnails', text='Render Thumbnails')
             row = box.row()
             row.operator('quicktitler.create', text='Create New Title').action = 'create'
         else:
@@ -2714,12 +4489,36 @@ class QUICKTITLING_PT_Panel(bpy.types.Panel):
             row = box.row()
             row.operator('quicktitler.replace_image', text='Render To Image')
             row = box.row()
+            row.operator('quicktitler.cache_title', text='Cache Title Frames')
+            row = box.row()
             row.operator('quicktitler.create', text='Update Title').action = 'update_all'
             row = box.row()
             row.operator('quicktitler.create', text='Duplicate Current Title').action = 'create'
 
         row = box.row()
         row.prop(context.scene.quicktitler, 'autoupdate')
+        row = box.row()
+        row.prop(context.scene.quicktitler, 'pick_mode', expand=True)
+        row = box.row()
+        row.prop(context.scene.quicktitler, 'overlay_show_all')
+        row = box.row()
+        row.prop(context.scene.quicktitler, 'render_profile', expand=True)
+        row = box.row(align=True)
+        row.prop(context.scene.quicktitler, 'adaptive_resolution', text='Adaptive Resolution')
+        split = row.split(align=True)
+        split.prop(context.scene.quicktitler, 'resolution_error', text='Error')
+        split.enabled = context.scene.quicktitler.adaptive_resolution
+        row = box.row(align=True)
+        row.prop(context.scene.quicktitler, 'font_directories')
+        row.operator('quicktitler.rescan_fonts', text='', icon='FILE_REFRESH')
+        row = box.row(align=True)
+        row.prop(context.scene.quicktitler, 'use_fallback_font', text='')
+        split = row.split(align=True)
+        split.prop(context.scene.quicktitler, 'fallback_font')
+        split.enabled = context.scene.quicktitler.use_fallback_font
+        row = box.row(align=True)
+        row.operator('quicktitler.bake_titles', text='Bake All Titles')
+        row.prop(context.scene.quicktitler, 'bake_threads', text='Processes')
         row = layout.row()
         row.separator()
 
@@ -2795,6 +4594,13 @@ class QUICKTITLING_PT_Panel(bpy.types.Panel):
                 split = row.split(factor=0.9, align=True)
                 split.menu('QUICKTITLING_MT_fonts_menu', text=current_object.font)
                 split.operator('quicktitler.load_font', text='+')
+                if current_object.missing_glyphs:
+                    row = subarea.row()
+                    row.alert = True
+                    if context.scene.quicktitler.use_fallback_font and context.scene.quicktitler.fallback_font:
+                        row.label(text="Using fallback font for: "+current_object.missing_glyphs, icon='INFO')
+                    else:
+                        row.label(text="Font is missing: "+current_object.missing_glyphs, icon='ERROR')
 
                 row = subarea.row()
                 row.prop(current_object, 'word_wrap', text='Wrapping')
@@ -2803,6 +4609,13 @@ class QUICKTITLING_PT_Panel(bpy.types.Panel):
                 row = subarea.row()
                 row.prop(current_object, 'align', expand=True)
 
+                row = subarea.row()
+                row.prop(current_object, 'glyph_mode', text='Animate By')
+                if current_object.glyph_mode != 'NONE':
+                    row = subarea.row()
+                    row.prop(current_object, 'glyph_stagger', text='Stagger')
+                    row.prop(current_object, 'glyph_reverse', text='Reverse')
+
             row = outline.row(align=True)
             split = row.split(factor=.15, align=True)
             split.label(text='Pos:')
@@ -2840,6 +4653,8 @@ class QUICKTITLING_PT_Panel(bpy.types.Panel):
                 row = subarea.row()
                 row.label(text="Outline", icon="MOD_SKIN")
                 row.prop(current_object, 'outline', text="Enable")
+                if current_object.type == 'TEXT' and current_object.glyph_mode != 'NONE':
+                    subarea.enabled = False
                 row = subarea.row()
                 split = row.split(factor=.85)
                 subsplit = split.split()
@@ -2975,6 +4790,83 @@ class QUICKTITLING_PT_Panel(bpy.types.Panel):
             row.prop(quicktitle_preset, 'shadowy', text='Shadow Y Offset')
 
 
+class QUICKTITLING_PT_DebugPanel(bpy.types.Panel):
+    #Panel showing profiling information for title updates
+    bl_label = "Debug"
+    bl_space_type = 'SEQUENCE_EDITOR'
+    bl_region_type = 'UI'
+    bl_category = 'QuickTitling'
+    bl_parent_id = 'QUICKTITLING_PT_Panel'
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        row = layout.row()
+        row.prop(context.scene.quicktitler, 'debug_profiling')
+        if not update_profiler.records:
+            return
+        row = layout.row(align=True)
+        row.operator('quicktitler.profile_export', text='Save Profile')
+        row.operator('quicktitler.profile_clear', text='Clear')
+
+        record = update_profiler.records[-1]
+        box = layout.box()
+        row = box.row()
+        row.label(text=record['title']+" ("+record['time']+")")
+        row = box.row()
+        row.label(text="Total: "+format(record['total'] * 1000, '.2f')+" ms")
+        for stage, elapsed in sorted(record['stages'].items(), key=lambda stage: stage[1], reverse=True):
+            row = box.row()
+            row.label(text=stage)
+            row.label(text=format(elapsed * 1000, '.2f')+" ms")
+        if record['counts']:
+            box = layout.box()
+            row = box.row()
+            row.label(text="Data Writes:")
+            for counter, amount in sorted(record['counts'].items()):
+                row = box.row()
+                row.label(text=counter)
+                row.label(text=str(amount))
+        if record['objects']:
+            box = layout.box()
+            row = box.row()
+            row.label(text="Slowest Objects:")
+            object_totals = [(sum(stages.values()), name) for name, stages in record['objects'].items()]
+            for elapsed, name in sorted(object_totals, reverse=True)[:5]:
+                row = box.row()
+                row.label(text=name)
+                row.label(text=format(elapsed * 1000, '.2f')+" ms")
+        row = layout.row()
+        row.label(text="Recorded Updates: "+str(len(update_profiler.records)))
+
+
+class QuickTitlingProfileExport(bpy.types.Operator, ExportHelper):
+    #Operator to save the recorded update profiles to a json file
+    bl_idname = 'quicktitler.profile_export'
+    bl_label = 'Save Update Profile'
+    bl_description = 'Saves the recorded title update timings to a json file'
+
+    filename_ext = ".json"
+    filter_glob: bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+
+    def execute(self, context):
+        with open(self.filepath, 'w') as profile_file:
+            json.dump(list(update_profiler.records), profile_file, indent=2)
+        self.report({'INFO'}, "Saved Update Profile As: "+self.filepath)
+        return {'FINISHED'}
+
+
+class QuickTitlingProfileClear(bpy.types.Operator):
+    #Operator to forget the recorded update profiles
+    bl_idname = 'quicktitler.profile_clear'
+    bl_label = 'Clear Update Profile'
+    bl_description = 'Clears the recorded title update timings'
+
+    def execute(self, context):
+        update_profiler.clear()
+        return {'FINISHED'}
+
+
 class QuickTitlingSavePreset(bpy.types.Operator):
     #Operator to save the current editing title to the scene quicktitles
     bl_idname = 'quicktitler.save_preset'
@@ -3001,15 +4893,34 @@ class QuickTitlingSavePreset(bpy.types.Operator):
 
 
 class QuickTitlingReplaceWithImage(bpy.types.Operator, ExportHelper):
-    #operator that renders out the middle frame of a title scene to an image, then mutes the original sequence and loads that image in
+    #operator that renders out a title scene to an image, image sequence or movie, then mutes the original sequence and loads the render in
     bl_idname = 'quicktitler.replace_image'
     bl_label = 'Replace With Image'
-    bl_description = 'Renders out an image of the quicktitle scene, and places it on the timeline while muting the original.'
+    bl_description = 'Renders out the quicktitle scene, and places it on the timeline while muting the original.'
 
     filepath: bpy.props.StringProperty()
     filename_ext = ".png"
-    filter_glob: bpy.props.StringProperty(default="*.png", options={'HIDDEN'})
+    filter_glob: bpy.props.StringProperty(default="*.png;*.mov", options={'HIDDEN'})
     check_extension = True
+    mode: bpy.props.EnumProperty(
+        name="Render",
+        items=[('STILL', 'Still Image', 'Render the middle frame of the title to a single image', 1),
+               ('SEQUENCE', 'Image Sequence', 'Render the title to a folder of images named after the file, static parts of the title are only rendered once', 2),
+               ('MOVIE', 'Movie', 'Render the whole title to a QuickTime Animation movie, which keeps transparency', 3)],
+        default='STILL')
+
+    def check(self, context):
+        #change the file extension to match the render mode
+        extension = '.mov' if self.mode == 'MOVIE' else '.png'
+        path, old_extension = os.path.splitext(self.filepath)
+        if old_extension.lower() in ['.png', '.mov']:
+            filepath = path + extension
+        else:
+            filepath = self.filepath + extension
+        if filepath != self.filepath:
+            self.filepath = filepath
+            return True
+        return False
 
     def invoke(self, context, event):
         #set the default filename
@@ -3023,11 +4934,62 @@ class QuickTitlingReplaceWithImage(bpy.types.Operator, ExportHelper):
         #after the file browser is closed, save the image
         quicktitle_sequence = titling_scene_selected()
         if quicktitle_sequence:
-            if self.filepath.endswith('.png'):
+            extension = '.mov' if self.mode == 'MOVIE' else '.png'
+            if self.filepath.endswith(extension):
                 imagepath = self.filepath
             else:
-                imagepath = self.filepath+'.png'
+                imagepath = self.filepath+extension
             scene = quicktitle_sequence.scene
+            sequence_editor = bpy.context.scene.sequence_editor
+            if self.mode == 'SEQUENCE':
+                #render the frames to a folder named after the file
+                directory = os.path.splitext(imagepath)[0]
+                os.makedirs(directory, exist_ok=True)
+                frame_map, fade = title_frame_map(scene)
+                render_title_frames(scene, directory, sorted(set(frame_map.values())), fade)
+                self.report({'INFO'}, "Rendered QuickTitle to: "+directory)
+                strip = add_frames_strip(bpy.context.scene, quicktitle_sequence, directory, frame_map, fade, os.path.basename(directory))
+                sequence_editor.active_strip = strip
+                return {'FINISHED'}
+
+            if self.mode == 'MOVIE':
+                #render the whole title to an intra-frame codec that keeps transparency
+                image_settings = scene.render.image_settings
+                old_media_type = getattr(image_settings, 'media_type', None)
+                old_file_format = image_settings.file_format
+                old_color_mode = image_settings.color_mode
+                old_ffmpeg_format = scene.render.ffmpeg.format
+                old_ffmpeg_codec = scene.render.ffmpeg.codec
+                old_filepath = scene.render.filepath
+                oldscene = bpy.context.scene
+                try:
+                    if old_media_type is not None:
+                        image_settings.media_type = 'VIDEO'
+                    image_settings.file_format = 'FFMPEG'
+                    scene.render.ffmpeg.format = 'QUICKTIME'
+                    scene.render.ffmpeg.codec = 'QTRLE'
+                    image_settings.color_mode = 'RGBA'
+                    scene.render.filepath = imagepath
+                    bpy.context.window.scene = scene
+                    bpy.ops.render.render(animation=True)
+                finally:
+                    bpy.context.window.scene = oldscene
+                    scene.render.ffmpeg.format = old_ffmpeg_format
+                    scene.render.ffmpeg.codec = old_ffmpeg_codec
+                    if old_media_type is not None:
+                        image_settings.media_type = old_media_type
+                    image_settings.file_format = old_file_format
+                    image_settings.color_mode = old_color_mode
+                    scene.render.filepath = old_filepath
+                self.report({'INFO'}, "Rendered QuickTitle as: "+imagepath)
+
+                #load the movie into the sequencer
+                quicktitle_sequence.mute = True
+                strip = sequence_editor.strips.new_movie(name=os.path.basename(imagepath), filepath=imagepath, channel=quicktitle_sequence.channel + 1, frame_start=int(quicktitle_sequence.frame_start))
+                strip.blend_type = 'ALPHA_OVER'
+                sequence_editor.active_strip = strip
+                return {'FINISHED'}
+
             scene.render.filepath = imagepath
             oldscene = bpy.context.scene
             scene.frame_current = int(round(scene.frame_end / 2))
@@ -3046,6 +5008,184 @@ class QuickTitlingReplaceWithImage(bpy.types.Operator, ExportHelper):
         return {'FINISHED'}
 
 
+class QuickTitlingCacheTitle(bpy.types.Operator):
+    #operator that renders all frames of a title scene to the disk cache, then plays them back from there instead of the title scene
+    bl_idname = 'quicktitler.cache_title'
+    bl_label = 'Cache Title Frames'
+    bl_description = 'Renders the frames of this title to a cache folder and plays them back instead of rendering the title scene.  Frames that are already cached will not be rendered again.'
+
+    def execute(self, context):
+        quicktitle_sequence = titling_scene_selected()
+        if not quicktitle_sequence:
+            return {'CANCELLED'}
+        scene = quicktitle_sequence.scene
+        remove_title_cache(quicktitle_sequence)
+
+        #find the frames that actually need to be rendered, static parts of the title only need one frame
+        directory, frame_map, fade, state_hash, render_frames, frame_hashes = title_cache_plan(scene, context.scene.quicktitler)
+        if render_frames:
+            render_title_frames(scene, directory, render_frames, fade)
+            store_cache_frames(directory, frame_hashes)
+
+        add_cache_strip(context.scene, quicktitle_sequence, directory, frame_map, fade, state_hash)
+        self.report({'INFO'}, "Cached QuickTitle frames in: "+directory)
+        return {'FINISHED'}
+
+
+class QuickTitlingBakeTitles(bpy.types.Operator):
+    #Operator that renders all titles in the sequencer in background blender processes, and replaces them with the rendered frames as each one finishes.
+    #Each title scene is saved to a temporary blend file, and its frames are split into jobs that are run a few at a time.
+    bl_idname = 'quicktitler.bake_titles'
+    bl_label = 'Bake Titles'
+    bl_description = 'Renders every title in the sequencer to image sequences in the background, and replaces the titles with the rendered frames.  Press Escape to cancel.'
+
+    timer = None
+    temp_directory = ''
+    titles = []
+    queue = []
+    running = []
+    threads = 1
+    frames_total = 0
+    frames_done = 0
+
+    def write_title(self, title_scene, filepath, fade):
+        #saves a title scene to a blend file, set up to render the way the cache expects
+        profile = current_render_profile()
+        muted = []
+        try:
+            if profile != 'FINAL':
+                apply_render_profile(title_scene, 'FINAL')
+            muted = hold_title_fade(title_scene, fade)
+            bpy.data.libraries.write(filepath, {title_scene}, fake_user=True, path_remap='ABSOLUTE')
+        finally:
+            for fcurve in muted:
+                fcurve.mute = False
+            if profile != 'FINAL':
+                apply_render_profile(title_scene, profile)
+
+    def invoke(self, context, event):
+        sequence_editor = context.scene.sequence_editor
+        if not sequence_editor:
+            return {'CANCELLED'}
+        settings = context.scene.quicktitler
+        self.threads = settings.bake_threads if settings.bake_threads > 0 else (os.cpu_count() or 1)
+        self.temp_directory = tempfile.mkdtemp(prefix='QuickTitling Bake ')
+        self.titles = []
+        self.queue = []
+        self.running = []
+        self.frames_done = 0
+
+        #find the title strips, a title scene only needs to be rendered once
+        found_scenes = []
+        for sequence in sequence_editor.strips_all:
+            if sequence.type != 'SCENE' or not sequence.scene or not is_title_scene(sequence.scene):
+                continue
+            if sequence.scene.name in found_scenes:
+                continue
+            found_scenes.append(sequence.scene.name)
+            title_scene = sequence.scene
+            directory, frame_map, fade, state_hash, render_frames, frame_hashes = title_cache_plan(title_scene, settings)
+            if not render_frames and title_scene.quicktitler.cache_hash == state_hash and title_scene.quicktitler.cache_strip in sequence_editor.strips_all:
+                #title has not changed since it was last baked
+                continue
+            title = {'sequence': sequence.name, 'directory': directory, 'frame_map': frame_map, 'fade': fade, 'state_hash': state_hash, 'frames': render_frames, 'frame_hashes': frame_hashes, 'jobs': 0, 'failed': False}
+            if render_frames:
+                title['blend'] = os.path.join(self.temp_directory, str(len(self.titles)).zfill(4)+'.blend')
+                self.write_title(title_scene, title['blend'], fade)
+            self.titles.append(title)
+
+        #split the frames into jobs
+        self.frames_total = sum(len(title['frames']) for title in self.titles)
+        chunk_size = max(10, int(ceil(self.frames_total / self.threads)))
+        for title in self.titles:
+            if not title['frames']:
+                #everything is already cached
+                self.finish_title(context, title)
+                continue
+            title_scene = sequence_editor.strips_all[title['sequence']].scene
+            for index in range(0, len(title['frames']), chunk_size):
+                frames = title['frames'][index:index + chunk_size]
+                command = [bpy.app.binary_path, '-b', '--factory-startup', title['blend'], '-S', title_scene.name, '-o', os.path.join(title['directory'], '#####'), '-F', 'PNG', '-x', '1', '-f', ','.join(str(frame) for frame in frames)]
+                self.queue.append({'title': title, 'frames': frames, 'command': command, 'process': None})
+                title['jobs'] = title['jobs'] + 1
+
+        if not self.queue:
+            self.cleanup(context)
+            self.report({'INFO'}, 'All titles are already baked')
+            return {'FINISHED'}
+        context.window_manager.progress_begin(0, self.frames_total)
+        self.timer = context.window_manager.event_timer_add(0.5, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def finish_title(self, context, title):
+        #swaps a finished title for its rendered frames
+        sequence_editor = context.scene.sequence_editor
+        sequence = sequence_editor.strips_all.get(title['sequence'])
+        if not sequence:
+            return
+        store_cache_frames(title['directory'], title['frame_hashes'])
+        missing = [frame for frame in set(title['frame_map'].values()) if not os.path.isfile(os.path.join(title['directory'], str(frame).zfill(5)+'.png'))]
+        if title['failed'] or missing:
+            self.report({'WARNING'}, 'Could not bake title: '+sequence.name)
+            return
+        add_cache_strip(context.scene, sequence, title['directory'], title['frame_map'], title['fade'], title['state_hash'])
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.cancel(context)
+            self.report({'WARNING'}, 'Title baking cancelled')
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        #check for finished renders
+        for job in list(self.running):
+            if job['process'].poll() is not None:
+                self.running.remove(job)
+                title = job['title']
+                title['jobs'] = title['jobs'] - 1
+                if job['process'].returncode != 0:
+                    title['failed'] = True
+                self.frames_done = self.frames_done + len(job['frames'])
+                if title['jobs'] == 0:
+                    self.finish_title(context, title)
+
+        #start new renders
+        while self.queue and len(self.running) < self.threads:
+            job = self.queue.pop(0)
+            job['process'] = subprocess.Popen(job['command'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            self.running.append(job)
+
+        context.window_manager.progress_update(self.frames_done)
+        context.workspace.status_text_set('Baking Titles: '+str(self.frames_done)+' of '+str(self.frames_total)+' frames rendered, press Escape to cancel')
+        if not self.queue and not self.running:
+            self.cleanup(context)
+            self.report({'INFO'}, 'Baked '+str(len(self.titles))+' titles')
+            return {'FINISHED'}
+        return {'PASS_THROUGH'}
+
+    def cleanup(self, context):
+        if self.timer:
+            context.window_manager.event_timer_remove(self.timer)
+            self.timer = None
+        context.window_manager.progress_end()
+        context.workspace.status_text_set(None)
+        shutil.rmtree(self.temp_directory, ignore_errors=True)
+
+    def cancel(self, context):
+        for job in self.running:
+            job['process'].terminate()
+        for job in self.running:
+            try:
+                job['process'].wait(timeout=5)
+            except:
+                job['process'].kill()
+        self.running = []
+        self.queue = []
+        self.cleanup(context)
+
+
 class QuickTitlingObjectMoveUp(bpy.types.Operator):
     #Operator to move a specific object up in the list of objects, object index must be specified
     bl_idname = 'quicktitler.object_up'
@@ -3184,6 +5324,7 @@ class QuickTitlingObjectDelete(bpy.types.Operator):
                     outline_object = scene.objects[outline_object_name]
                     scene.collection.objects.unlink(outline_object)
                     bpy.data.objects.remove(outline_object, do_unlink=True)
+                remove_glyphs(title_object)
                 scene.collection.objects.unlink(title_object)
                 bpy.data.objects.remove(title_object, do_unlink=True)
 
@@ -3318,6 +5459,40 @@ class QuickTitlingPresetDelete(bpy.types.Operator):
         return {'FINISHED'}
 
 
+class QuickTitlingPresetThumbnails(bpy.types.Operator):
+    #Operator to render thumbnails for every preset in a folder, by default this is done in a background blender process so the interface is not blocked
+    bl_idname = 'quicktitler.preset_thumbnails'
+    bl_label = 'Render Preset Thumbnails'
+    bl_description = 'Renders a thumbnail image for every QuickTitling preset in a folder'
+
+    directory: bpy.props.StringProperty(subtype='DIR_PATH')
+    background: bpy.props.BoolProperty(
+        name="Render In Background",
+        default=True,
+        description="Render the thumbnails in a separate background Blender process")
+
+    def invoke(self, context, event):
+        if not self.directory:
+            self.directory = get_presets_directory()
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        directory = bpy.path.abspath(self.directory)
+        if not os.path.isdir(directory):
+            self.report({'WARNING'}, 'Folder not found: '+directory)
+            return {'CANCELLED'}
+        if self.background and not bpy.app.background:
+            expression = 'import bpy; bpy.ops.quicktitler.preset_thumbnails(directory='+repr(directory)+', background=False)'
+            command = [bpy.app.binary_path, '-b', '--factory-startup', '--python', os.path.realpath(__file__), '--python-expr', expression]
+            subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            self.report({'INFO'}, 'Rendering preset thumbnails in the background')
+            return {'FINISHED'}
+        rendered = render_preset_thumbnails(directory)
+        self.report({'INFO'}, 'Rendered '+str(rendered)+' preset thumbnails')
+        return {'FINISHED'}
+
+
 class QuickTitlingPresetExport(bpy.types.Operator, ExportHelper):
     #Operator to export the current QuickTitler preset to a file.
     bl_idname = 'quicktitler.preset_export'
@@ -3350,37 +5525,9 @@ class QuickTitlingPresetExport(bpy.types.Operator, ExportHelper):
                 imagepath = self.filepath
             else:
                 imagepath = imagepath+'.jpg'
-            scene = quicktitle_sequence.scene
-            scene.render.filepath = imagepath
-            old_file_format = scene.render.image_settings.file_format
-            old_quality = scene.render.image_settings.quality
-            old_resolution_percentage = scene.render.resolution_percentage
-            old_color_mode = scene.render.image_settings.color_mode
-            old_res_x = scene.render.resolution_x
-            old_res_y = scene.render.resolution_y
-            aspect = scene.render.resolution_x / scene.render.resolution_y
-            res = 300
-            scene.render.resolution_x = res
-            scene.render.resolution_y = int(res / aspect)
-            scene.render.image_settings.file_format = 'JPEG'
-            scene.render.image_settings.quality = 80
-            scene.render.resolution_percentage = 100
-            scene.render.image_settings.color_mode = 'RGB'
-
-            oldscene = bpy.context.scene
-            scene.frame_current = int(round(scene.frame_end / 2))
-            bpy.context.window.scene = scene
-            bpy.ops.render.render(write_still=True)
-            bpy.context.window.scene = oldscene
+            render_thumbnail(quicktitle_sequence.scene, imagepath)
             self.report({'INFO'}, "Rendered QuickTitle Preview As: "+imagepath)
 
-            scene.render.resolution_x = old_res_x
-            scene.render.resolution_y = old_res_y
-            scene.render.image_settings.file_format = old_file_format
-            scene.render.image_settings.quality = old_quality
-            scene.render.resolution_percentage = old_resolution_percentage
-            scene.render.image_settings.color_mode = old_color_mode
-
         preset = current_quicktitle()
         if not preset:
             return {'CANCELED'}
@@ -3476,6 +5623,12 @@ class QuickTitlingPresetExport(bpy.types.Operator, ExportHelper):
                 Tree.SubElement(objects, 'wrap_width').text = str(title_object.wrap_width)
             if title_object.align != get_default('align'):
                 Tree.SubElement(objects, 'align').text = title_object.align
+            if title_object.glyph_mode != get_default('glyph_mode'):
+                Tree.SubElement(objects, 'glyph_mode').text = title_object.glyph_mode
+            if title_object.glyph_stagger != get_default('glyph_stagger'):
+                Tree.SubElement(objects, 'glyph_stagger').text = str(title_object.glyph_stagger)
+            if title_object.glyph_reverse != get_default('glyph_reverse'):
+                Tree.SubElement(objects, 'glyph_reverse').text = str(title_object.glyph_reverse)
             if title_object.outline != get_default('outline'):
                 Tree.SubElement(objects, 'outline').text = str(title_object.outline)
             if title_object.outline_size != get_default('outline_size'):
@@ -3769,6 +5922,27 @@ class QuickTitlingFontMenu(bpy.types.Menu):
         for font in fonts:
             layout.operator('quicktitler.change_font', text=font.name).font = font.name
 
+        #fonts in the font folders that are not loaded yet, these are loaded when they are used
+        scan_fonts(context.scene.quicktitler)
+        loaded = [font.name.lower() for font in fonts]
+        unloaded = [name for name in font_registry['names'] if name.lower() not in loaded]
+        if unloaded:
+            layout.separator()
+            for name in unloaded:
+                layout.operator('quicktitler.change_font', text=name).font = name
+
+
+class QuickTitlingRescanFonts(bpy.types.Operator):
+    #Operator to search the font folders again for new fonts
+    bl_idname = 'quicktitler.rescan_fonts'
+    bl_label = 'Rescan Fonts'
+    bl_description = 'Search the font folders again for fonts'
+
+    def execute(self, context):
+        scan_fonts(context.scene.quicktitler, force=True)
+        self.report({'INFO'}, 'Found '+str(len(font_registry['names']))+' fonts')
+        return {'FINISHED'}
+
 
 class QuickTitlingChangeFont(bpy.types.Operator):
     #Operator for changing the QuickTitler font on the current preset.  The font variable must be specified
@@ -3854,6 +6028,21 @@ class QuickTitleSettings(bpy.types.PropertyGroup):
     autoupdate: bpy.props.BoolProperty(
         name="Auto-Update Titles",
         default=True)
+    pick_mode: bpy.props.EnumProperty(
+        name="Click Selection",
+        items=[('BOUNDS', 'Bounds', 'Select objects by their bounding boxes, only checking the exact shape when boxes overlap', 1), ('EXACT', 'Exact', 'Always select objects by their exact shape', 2)],
+        default='BOUNDS',
+        description="How objects are selected when clicking in the sequencer preview")
+    overlay_show_all: bpy.props.BoolProperty(
+        name="Show All Object Bounds",
+        default=False,
+        description="Display the bounds of every object in the sequencer preview, not just the selected object")
+    render_profile: bpy.props.EnumProperty(
+        name="Render Quality",
+        items=[('DRAFT', 'Draft', 'Low quality, fastest display while editing', 1), ('PREVIEW', 'Preview', 'Medium quality for previewing playback', 2), ('FINAL', 'Final', 'Full quality', 3)],
+        default='FINAL',
+        description="Render quality of all titles while editing.  Titles will always use final quality when rendering",
+        update=render_profile_update)
     current_icon: bpy.props.EnumProperty(
         name='Current Icon',
         items=current_icon_enum)
@@ -3862,12 +6051,55 @@ class QuickTitleSettings(bpy.types.PropertyGroup):
         default=False)
     current_quicktitle: bpy.props.PointerProperty(type=QuickTitle)
     quicktitles: bpy.props.CollectionProperty(type=QuickTitle)
+    bake_threads: bpy.props.IntProperty(
+        name="Bake Processes",
+        default=0,
+        min=0,
+        description="Number of titles rendered at the same time when baking titles, 0 will use the number of processors")
+    cache_hash: bpy.props.StringProperty(
+        name='Cached Title State',
+        default='')
+    cache_strip: bpy.props.StringProperty(
+        name='Cached Frames Strip',
+        default='')
+    font_directories: bpy.props.StringProperty(
+        name="Font Folders",
+        default='',
+        description="Folders that are searched for fonts used by presets, separate multiple folders with ';'",
+        update=font_directories_update)
+    use_fallback_font: bpy.props.BoolProperty(
+        name="Use Fallback Font",
+        default=False,
+        description="Show characters that are missing from a text object's font using the fallback font",
+        update=quicktitle_autoupdate_all)
+    fallback_font: bpy.props.StringProperty(
+        name="Fallback Font",
+        default='',
+        description="Name of the font used for missing characters, this can be a loaded font or a font in the font folders",
+        update=quicktitle_autoupdate_all)
+    adaptive_resolution: bpy.props.BoolProperty(
+        name="Adaptive Curve Resolution",
+        default=False,
+        description="Lower the curve and bevel resolution of small text and shapes, based on how large they are in the render",
+        update=quicktitle_autoupdate_all)
+    resolution_error: bpy.props.FloatProperty(
+        name="Curve Error",
+        default=0.25,
+        min=0.01,
+        max=4,
+        description="Largest distance in pixels that curves may be from their true shape when using adaptive curve resolution",
+        update=quicktitle_autoupdate_all)
+    debug_profiling: bpy.props.BoolProperty(
+        name="Profile Title Updates",
+        default=False,
+        description="Record how long each stage of title updates takes, shown in the debug panel")
 
 
 class QuickTitlingGrab(bpy.types.Operator):
     #Operator for moving title elements in the preview area
     bl_idname = 'quicktitle.grab'
     bl_label = "Grab/Move Title Object"
+    bl_options = {'UNDO'}
 
     lamp: bpy.props.BoolProperty(default=False)
     feedback = ''
@@ -3881,6 +6113,8 @@ class QuickTitlingGrab(bpy.types.Operator):
     start_x = 0
     start_y = 0
     start_z = 0
+    start_bounds = None
+    values = {}
     mouse_scale = 500
 
     @classmethod
@@ -3917,6 +6151,13 @@ class QuickTitlingGrab(bpy.types.Operator):
             mouse_x_delta = mouse_x_delta / 4
             mouse_y_delta = mouse_y_delta / 4
         mouse_delta = (mouse_x_delta + mouse_y_delta) / 2
+        if self.lamp:
+            name = 'Move Shadow'
+        else:
+            name = 'Move'
+        x = self.start_x
+        y = self.start_y
+        z = self.start_z
         if self.constrain == 'X':
             if self.value:
                 try:
@@ -3924,16 +6165,8 @@ class QuickTitlingGrab(bpy.types.Operator):
                     mouse_x_delta = -float_value
                 except:
                     pass
-            if self.lamp:
-                self.preset.shadowx = self.start_x - mouse_x_delta
-                self.preset.shadowy = self.start_y
-                self.preset.shadowsize = self.start_z
-                self.feedback = 'Move Shadow (X): '+str(round(-mouse_x_delta, 4))
-            else:
-                self.object_preset.x = self.start_x - mouse_x_delta
-                self.object_preset.y = self.start_y
-                self.object_preset.z = self.start_z
-                self.feedback = 'Move (X): '+str(round(-mouse_x_delta, 4))
+            x = self.start_x - mouse_x_delta
+            self.feedback = name+' (X): '+str(round(-mouse_x_delta, 4))
         elif self.constrain == 'Y':
             if self.value:
                 try:
@@ -3941,16 +6174,8 @@ class QuickTitlingGrab(bpy.types.Operator):
                     mouse_y_delta = -float_value
                 except:
                     pass
-            if self.lamp:
-                self.preset.shadowx = self.start_x
-                self.preset.shadowy = self.start_y - mouse_y_delta
-                self.preset.shadowsize = self.start_z
-                self.feedback = 'Move Shadow (Y): '+str(round(-mouse_y_delta, 4))
-            else:
-                self.object_preset.x = self.start_x
-                self.object_preset.y = self.start_y - mouse_y_delta
-                self.object_preset.z = self.start_z
-                self.feedback = 'Move (Y): '+str(round(-mouse_y_delta, 4))
+            y = self.start_y - mouse_y_delta
+            self.feedback = name+' (Y): '+str(round(-mouse_y_delta, 4))
         elif self.constrain == 'Z':
             if self.value:
                 try:
@@ -3958,40 +6183,40 @@ class QuickTitlingGrab(bpy.types.Operator):
                     mouse_delta = -float_value
                 except:
                     pass
-            if self.lamp:
-                self.preset.shadowx = self.start_x
-                self.preset.shadowy = self.start_y
-                self.preset.shadowsize = self.start_z - mouse_delta
-                self.feedback = 'Move Shadow (Z): '+str(round(-mouse_delta, 4))
-            else:
-                self.object_preset.x = self.start_x
-                self.object_preset.y = self.start_y
-                self.object_preset.z = self.start_z - mouse_delta
-                self.feedback = 'Move (Z): '+str(round(-mouse_delta, 4))
+            z = self.start_z - mouse_delta
+            self.feedback = name+' (Z): '+str(round(-mouse_delta, 4))
         else:
-            if self.lamp:
-                self.preset.shadowx = self.start_x - mouse_x_delta
-                self.preset.shadowy = self.start_y - mouse_y_delta
-                self.preset.shadowsize = self.start_z
-                self.feedback = 'Move Shadow: X: '+str(round(-mouse_x_delta, 4))+', Y: '+str(round(-mouse_y_delta, 4))
-            else:
-                self.object_preset.x = self.start_x - mouse_x_delta
-                self.object_preset.y = self.start_y - mouse_y_delta
-                self.object_preset.z = self.start_z
-                self.feedback = 'Move: X: '+str(round(-mouse_x_delta, 4))+', Y: '+str(round(-mouse_y_delta, 4))
+            x = self.start_x - mouse_x_delta
+            y = self.start_y - mouse_y_delta
+            self.feedback = name+': X: '+str(round(-mouse_x_delta, 4))+', Y: '+str(round(-mouse_y_delta, 4))
+
+        #only the blender objects are moved while dragging, the preset is set once at the end
+        if self.lamp:
+            self.values = {'shadowx': x, 'shadowy': y, 'shadowsize': z}
+            preview_lamp_transform(self.scene, self.preset, x, y, z)
+        else:
+            self.values = {'x': x, 'y': y, 'z': z}
+            pos_multiplier = layer_multiplier(self.preset, self.preset.selected_object)
+            preview_transform(self.scene, self.object_preset, location=(pos_multiplier * (x - self.start_x), pos_multiplier * (y - self.start_y), z - self.start_z))
+            preview_bounds(self.object_preset, self.start_bounds, offset=(x - self.start_x, y - self.start_y))
+
         if event.type in {'LEFTMOUSE', 'RET'}:
             overlay_info = ''
+            if self.lamp:
+                commit_transform(self.preset, self.values)
+            else:
+                #the previewed bounds are put back so they still match the title if auto update is off, an update measures them again
+                preview_transform(self.scene, self.object_preset)
+                preview_bounds(self.object_preset, self.start_bounds, restore=True)
+                commit_transform(self.object_preset, self.values)
             return {'FINISHED'}
 
         elif event.type in {'RIGHTMOUSE', 'ESC'}:
             if self.lamp:
-                self.preset.shadowx = self.start_x
-                self.preset.shadowy = self.start_y
-                self.preset.shadowsize = self.start_z
+                preview_lamp_transform(self.scene, self.preset, self.start_x, self.start_y, self.start_z)
             else:
-                self.object_preset.x = self.start_x
-                self.object_preset.y = self.start_y
-                self.object_preset.z = self.start_z
+                preview_transform(self.scene, self.object_preset)
+                preview_bounds(self.object_preset, self.start_bounds, restore=True)
             overlay_info = ''
             return {'CANCELLED'}
 
@@ -4002,7 +6227,9 @@ class QuickTitlingGrab(bpy.types.Operator):
         self.feedback = ''
         self.value = ''
         self.constrain = False
+        self.values = {}
         titling_sequence = titling_scene_selected()
+        sync_title_frame(titling_sequence)
         self.mouse_x = event.mouse_x
         self.mouse_y = event.mouse_y
         self.scene = titling_sequence.scene
@@ -4026,6 +6253,7 @@ class QuickTitlingGrab(bpy.types.Operator):
                 self.start_x = self.object_preset.x
                 self.start_y = self.object_preset.y
                 self.start_z = self.object_preset.z
+                self.start_bounds = (self.object_preset.bbleft, self.object_preset.bbbottom, self.object_preset.bbright, self.object_preset.bbtop)
                 object_name = self.object_preset.internal_name
                 if object_name in self.scene.objects:
                     region = context.region
@@ -4045,6 +6273,7 @@ class QuickTitlingRotate(bpy.types.Operator):
     #Operator for rotating title elements in the preview area
     bl_idname = 'quicktitle.rotate'
     bl_label = "Rotate Title Object"
+    bl_options = {'UNDO'}
 
     feedback = ''
     value = ''
@@ -4058,6 +6287,7 @@ class QuickTitlingRotate(bpy.types.Operator):
     start_x = 0
     start_y = 0
     start_z = 0
+    values = {}
     mouse_scale = 500
 
     @classmethod
@@ -4096,6 +6326,9 @@ class QuickTitlingRotate(bpy.types.Operator):
             mouse_y_delta = mouse_y_delta / 4
             mouse_delta = mouse_delta / 4
 
+        rot_x = self.start_x
+        rot_y = self.start_y
+        rot_z = self.start_z
         if self.constrain == 'X':
             if self.value:
                 try:
@@ -4103,9 +6336,7 @@ class QuickTitlingRotate(bpy.types.Operator):
                     mouse_y_delta = float_value
                 except:
                     pass
-            self.object_preset.rot_x = self.start_x + mouse_y_delta
-            self.object_preset.rot_y = self.start_y
-            self.object_preset.rot_z = self.start_z
+            rot_x = self.start_x + mouse_y_delta
             self.feedback = 'Rotate (X Axis): '+str(mouse_y_delta)
         elif self.constrain == 'Y':
             if self.value:
@@ -4114,9 +6345,7 @@ class QuickTitlingRotate(bpy.types.Operator):
                     mouse_x_delta = -float_value
                 except:
                     pass
-            self.object_preset.rot_x = self.start_x
-            self.object_preset.rot_y = self.start_y - mouse_x_delta
-            self.object_preset.rot_z = self.start_z
+            rot_y = self.start_y - mouse_x_delta
             self.feedback = 'Rotate (Y Axis): '+str(-mouse_x_delta)
         elif self.constrain == 'Z':
             if self.value:
@@ -4125,24 +6354,25 @@ class QuickTitlingRotate(bpy.types.Operator):
                     mouse_delta = float_value
                 except:
                     pass
-            self.object_preset.rot_x = self.start_x
-            self.object_preset.rot_y = self.start_y
-            self.object_preset.rot_z = self.start_z + mouse_delta
+            rot_z = self.start_z + mouse_delta
             self.feedback = 'Rotate (Z Axis): '+str(mouse_delta)
         else:
-            self.object_preset.rot_x = self.start_x + mouse_y_delta
-            self.object_preset.rot_y = self.start_y - mouse_x_delta
-            self.object_preset.rot_z = self.start_z
+            rot_x = self.start_x + mouse_y_delta
+            rot_y = self.start_y - mouse_x_delta
             self.feedback = 'Rotate: X Axis: '+str(mouse_y_delta)+', Y Axis: '+str(-mouse_x_delta)
 
+        #only the blender objects are rotated while dragging, the preset is set once at the end
+        self.values = {'rot_x': rot_x, 'rot_y': rot_y, 'rot_z': rot_z}
+        preview_transform(self.scene, self.object_preset, rotation=((rot_x - self.start_x) / 180.0 * pi, (rot_y - self.start_y) / 180.0 * pi, -(rot_z - self.start_z) / 180.0 * pi))
+
         if event.type in {'LEFTMOUSE', 'RET'}:
             overlay_info = ''
+            preview_transform(self.scene, self.object_preset)
+            commit_transform(self.object_preset, self.values)
             return {'FINISHED'}
 
         elif event.type in {'RIGHTMOUSE', 'ESC'}:
-            self.object_preset.rot_x = self.start_x
-            self.object_preset.rot_y = self.start_y
-            self.object_preset.rot_z = self.start_z
+            preview_transform(self.scene, self.object_preset)
             overlay_info = ''
             return {'CANCELLED'}
 
@@ -4153,7 +6383,9 @@ class QuickTitlingRotate(bpy.types.Operator):
         self.feedback = ''
         self.value = ''
         self.constrain = False
+        self.values = {}
         titling_sequence = titling_scene_selected()
+        sync_title_frame(titling_sequence)
         self.mouse_x = event.mouse_x
         self.mouse_y = event.mouse_y
         self.scene = titling_sequence.scene
@@ -4178,6 +6410,7 @@ class QuickTitlingScale(bpy.types.Operator):
     #Operator for scaling title elements in the preview area
     bl_idname = 'quicktitle.scale'
     bl_label = "Scale Title Object"
+    bl_options = {'UNDO'}
 
     feedback = ''
     value = ''
@@ -4192,6 +6425,8 @@ class QuickTitlingScale(bpy.types.Operator):
     start_x = 1
     start_y = 1
     start_z = 0
+    start_bounds = None
+    values = {}
     mouse_scale = 500
 
     @classmethod
@@ -4234,40 +6469,41 @@ class QuickTitlingScale(bpy.types.Operator):
                 scaler = float_value
             except:
                 pass
+        scale = self.start_scale
+        width = self.start_x
+        height = self.start_y
+        extrude = self.start_z
         if self.constrain == 'X':
             self.feedback = 'Scale X (Width): '+str(scaler)
-            self.object_preset.scale = self.start_scale
-            self.object_preset.width = self.start_x * scaler
-            self.object_preset.height = self.start_y
-            self.object_preset.extrude = self.start_z
+            width = self.start_x * scaler
         elif self.constrain == 'Y':
             self.feedback = 'Scale Y (Height): '+str(scaler)
-            self.object_preset.scale = self.start_scale
-            self.object_preset.width = self.start_x
-            self.object_preset.height = self.start_y * scaler
-            self.object_preset.extrude = self.start_z
+            height = self.start_y * scaler
         elif self.constrain == 'Z':
             self.feedback = 'Scale Z (Extrude): '+str(scaler)
-            self.object_preset.scale = self.start_scale
-            self.object_preset.width = self.start_x
-            self.object_preset.height = self.start_y
-            self.object_preset.extrude = self.start_z + scaler
+            extrude = self.start_z + scaler
         else:
             self.feedback = 'Scale: '+str(scaler)
-            self.object_preset.scale = self.start_scale * scaler
-            self.object_preset.width = self.start_x
-            self.object_preset.height = self.start_y
-            self.object_preset.extrude = self.start_z
+            scale = self.start_scale * scaler
+
+        #only the blender objects are scaled while dragging, the preset is set once at the end
+        self.values = {'scale': scale, 'width': width, 'height': height, 'extrude': extrude}
+        scale_x = ratio(scale * width, self.start_scale * self.start_x)
+        scale_y = ratio(scale * height, self.start_scale * self.start_y)
+        scale_z = ratio(scale, self.start_scale)
+        preview_transform(self.scene, self.object_preset, scale=(scale_x, scale_y, scale_z), extrude=extrude)
+        preview_bounds(self.object_preset, self.start_bounds, scale=(scale_x, scale_y))
 
         if event.type in {'LEFTMOUSE', 'RET'}:
             overlay_info = ''
+            preview_transform(self.scene, self.object_preset, extrude=self.start_z)
+            preview_bounds(self.object_preset, self.start_bounds, restore=True)
+            commit_transform(self.object_preset, self.values)
             return {'FINISHED'}
 
         elif event.type in {'RIGHTMOUSE', 'ESC'}:
-            self.object_preset.scale = self.start_scale
-            self.object_preset.width = self.start_x
-            self.object_preset.height = self.start_y
-            self.object_preset.extrude = self.start_z
+            preview_transform(self.scene, self.object_preset, extrude=self.start_z)
+            preview_bounds(self.object_preset, self.start_bounds, restore=True)
             overlay_info = ''
             return {'CANCELLED'}
 
@@ -4278,7 +6514,9 @@ class QuickTitlingScale(bpy.types.Operator):
         self.feedback = ''
         self.value = ''
         self.constrain = False
+        self.values = {}
         titling_sequence = titling_scene_selected()
+        sync_title_frame(titling_sequence)
         self.mouse_x = event.mouse_x
         self.mouse_y = event.mouse_y
         self.scene = titling_sequence.scene
@@ -4289,6 +6527,7 @@ class QuickTitlingScale(bpy.types.Operator):
             self.start_x = self.object_preset.width
             self.start_y = self.object_preset.height
             self.start_z = self.object_preset.extrude
+            self.start_bounds = (self.object_preset.bbleft, self.object_preset.bbbottom, self.object_preset.bbright, self.object_preset.bbtop)
             object_name = self.object_preset.internal_name
             if object_name in self.scene.objects:
                 self.title_object = self.scene.objects[object_name]
@@ -4313,9 +6552,23 @@ class QuickTitlingSelect(bpy.types.Operator):
                 return True
         return False
 
+    def objects_under_mouse(self, context, scene, loc_x, loc_y, x, y):
+        #returns all objects under the mouse, in the order they should be selected
+        if context.scene.quicktitler.pick_mode == 'BOUNDS':
+            #test the stored object bounds, only do a ray cast if more than one object is under the mouse
+            candidates = objects_in_bounds(scene, scene.quicktitler.current_quicktitle, loc_x, loc_y, scene.frame_current)
+            if len(candidates) > 1:
+                hits = objects_at_location(scene, x, y, objects=candidates)
+                return hits + [candidate for candidate in candidates if candidate not in hits]
+            return candidates
+        else:
+            names = [object_preset.internal_name for object_preset in scene.quicktitler.current_quicktitle.objects]
+            return [hit for hit in objects_at_location(scene, x, y) if hit.name in names]
+
     def invoke(self, context, event):
         add_overlay()
         quicktitle_sequence = titling_scene_selected()
+        sync_title_frame(quicktitle_sequence)
         scene = quicktitle_sequence.scene
         render_x = scene.render.resolution_x
         mouse_x = event.mouse_region_x
@@ -4323,17 +6576,52 @@ class QuickTitlingSelect(bpy.types.Operator):
         loc_x, loc_y = context.region.view2d.region_to_view(mouse_x, mouse_y)
         x = (loc_x / render_x) * 2
         y = (loc_y / render_x) * 2
-        title_object = object_at_location(scene, x, y)
+
+        #clicking repeatedly in the same place will cycle through all the objects under the mouse
+        key = (scene.name, context.scene.frame_current, title_revision, context.scene.quicktitler.pick_mode)
+        last_x, last_y = pick_cycle['mouse']
+        if pick_cycle['key'] == key and abs(mouse_x - last_x) <= 3 and abs(mouse_y - last_y) <= 3 and pick_cycle['objects']:
+            pick_cycle['index'] = (pick_cycle['index'] + 1) % len(pick_cycle['objects'])
+        else:
+            pick_cycle['key'] = key
+            pick_cycle['mouse'] = (mouse_x, mouse_y)
+            pick_cycle['objects'] = [title_object.name for title_object in self.objects_under_mouse(context, scene, loc_x, loc_y, x, y)]
+            pick_cycle['index'] = 0
+        if pick_cycle['objects']:
+            title_object = scene.objects.get(pick_cycle['objects'][pick_cycle['index']])
+        else:
+            title_object = None
         if title_object:
-            title_object_presets = scene.quicktitler.current_quicktitle.objects
-            for index, object_preset in enumerate(title_object_presets):
-                if object_preset.internal_name == title_object.name:
-                    scene.quicktitler.current_quicktitle.selected_object = index
-                    #quicktitle_autoupdate()
-                    break
+            index = preset_index(scene.quicktitler.current_quicktitle, title_object)
+            if index >= 0:
+                scene.quicktitler.current_quicktitle.selected_object = index
         return {'FINISHED'}
 
 
+class QuickTitlingHover(bpy.types.Operator):
+    #Operator run on mouse movement to highlight the object under the mouse, uses only the stored bounds so it is fast enough to run constantly
+    bl_idname = 'quicktitle.hover'
+    bl_label = 'Highlight Title Object'
+    bl_options = {'INTERNAL'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.quicktitler.overlay_show_all and titling_scene_selected() is not None
+
+    def invoke(self, context, event):
+        quicktitle_sequence = titling_scene_selected()
+        scene = quicktitle_sequence.scene
+        loc_x, loc_y = context.region.view2d.region_to_view(event.mouse_region_x, event.mouse_region_y)
+        quicktitle = scene.quicktitler.current_quicktitle
+        candidates = objects_in_bounds(scene, quicktitle, loc_x, loc_y, get_title_frame(quicktitle_sequence))
+        index = preset_index(quicktitle, candidates[0]) if candidates else -1
+        if hover_object['scene'] != scene.name or hover_object['index'] != index:
+            hover_object['scene'] = scene.name
+            hover_object['index'] = index
+            context.area.tag_redraw()
+        return {'PASS_THROUGH'}
+
+
 class QuickTitlingAddObject(bpy.types.Menu):
     bl_idname = 'QUICKTITLING_MT_add_object_menu'
     bl_label = 'Add Title Object'
@@ -4400,6 +6688,7 @@ class QuickTitlingTool(bpy.types.WorkSpaceTool):
     bl_keymap = (
         ("quicktitle.select", {"type": 'RIGHTMOUSE', "value": 'PRESS'}, None),
         ("quicktitle.select", {"type": 'LEFTMOUSE', "value": 'PRESS'}, None),
+        ("quicktitle.hover", {"type": 'MOUSEMOVE', "value": 'ANY'}, None),
         ("quicktitle.grab", {"type": "G", "value": "PRESS"}, None),
         ("quicktitle.rotate", {"type": "R", "value": "PRESS"}, None),
         ("quicktitle.scale", {"type": "S", "value": "PRESS"}, None),
@@ -4458,9 +6747,11 @@ classes = [QuickTitlingGrab, QuickTitleAnimation, QuickTitleObject, QuickTitle,
            QuickTitlingAnimationMenu, QuickTitlingPresetDelete, QuickTitlingPresetExport, QuickTitlingPresetImport,
            QuickTitlingPresetMenu, QuickTitlingPresetSelect, QuickTitlingPresetLoad, QuickTitlingLoadFont,
            QuickTitlingFontMenu, QuickTitlingChangeFont, QuickTitlingMaterialMenu, QuickTitlingChangeMaterial,
-           QuickTitlingCreate, QuickTitleSettings, QuickTitlingRotate, QuickTitlingScale, QuickTitlingSelect,
+           QuickTitlingCreate, QuickTitleSettings, QuickTitlingRotate, QuickTitlingScale, QuickTitlingSelect, QuickTitlingHover,
            QuickTitlingAddObject, QuickTitlingDeleteMenu, QuickTitlingPresetSelectAdd, QuickTitlingPresetMenuAdd,
-           QuickTitlingNewMaterial]
+           QuickTitlingNewMaterial, QuickTitlingCacheTitle, QuickTitlingBakeTitles,
+           QuickTitlingPresetThumbnails, QUICKTITLING_PT_DebugPanel, QuickTitlingProfileExport, QuickTitlingProfileClear,
+           QuickTitlingRescanFonts]
 
 
 def register():
@@ -4483,11 +6774,25 @@ def register():
     bpy.types.SEQUENCER_MT_add.append(draw_preset_add_menu)
     bpy.utils.register_tool(QuickTitlingTool, separator=True)
 
+    #Handlers
+    bpy.app.handlers.frame_change_post.append(quicktitle_frame_change)
+    bpy.app.handlers.render_init.append(quicktitle_render_init)
+    bpy.app.handlers.render_complete.append(quicktitle_render_complete)
+    bpy.app.handlers.render_cancel.append(quicktitle_render_complete)
+
 
 def unregister():
     #Unregister classes
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
+    if quicktitle_frame_change in bpy.app.handlers.frame_change_post:
+        bpy.app.handlers.frame_change_post.remove(quicktitle_frame_change)
+    if quicktitle_render_init in bpy.app.handlers.render_init:
+        bpy.app.handlers.render_init.remove(quicktitle_render_init)
+    if quicktitle_render_complete in bpy.app.handlers.render_complete:
+        bpy.app.handlers.render_complete.remove(quicktitle_render_complete)
+    if quicktitle_render_complete in bpy.app.handlers.render_cancel:
+        bpy.app.handlers.render_cancel.remove(quicktitle_render_complete)
     #keymap = bpy.context.window_manager.keyconfigs.addon.keymaps['SequencerPreview']
 
 
@@ -0,0 +1,186 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Headless benchmark for QuickTitling, run with:
+#  blender -b --factory-startup --python benchmark.py -- --output results.json
+#Optional arguments after '--':
+#  --output <file>    write the results to a json file as well as printing them
+#  --sizes 1,10,100   number of objects in the synthetic titles
+#  --repeat 3         number of times each measurement is repeated
+#
+#Blender has no window when running in the background, so the sequencer parts of creating and updating a title
+#(adding the strip and reloading it) are not timed, only the title scene itself is created and updated.
+
+import bpy
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import platform
+import importlib.util
+
+
+sizes_default = [1, 10, 100, 500]
+object_types = ['TEXT', 'BOX', 'CIRCLE']
+
+
+def load_addon():
+    #imports the addon from the folder this script is in and registers it
+    directory = os.path.dirname(os.path.realpath(__file__))
+    spec = importlib.util.spec_from_file_location('QuickTitling', os.path.join(directory, '__init__.py'), submodule_search_locations=[directory])
+    addon = importlib.util.module_from_spec(spec)
+    sys.modules['QuickTitling'] = addon
+    spec.loader.exec_module(addon)
+    addon.register()
+    return addon
+
+
+def timed(function, repeat=1):
+    #runs a function a number of times and returns the timings in seconds, along with the last result
+    times = []
+    result = None
+    for index in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return {'min': min(times), 'mean': sum(times) / len(times), 'max': max(times), 'runs': len(times)}, result
+
+
+def build_title(preset, size):
+    #fills a preset with a grid of text, box and circle objects
+    preset.objects.clear()
+    preset.name = 'Benchmark '+str(size)
+    columns = max(1, int(size ** 0.5))
+    for index in range(size):
+        title_object = preset.objects.add()
+        title_object.type = object_types[index % len(object_types)]
+        title_object.name = title_object.type.capitalize()+' '+str(index)
+        title_object.x = ((index % columns) / columns) * 1.6 - 0.8
+        title_object.y = ((index // columns) / columns) * 0.9 - 0.45
+        title_object.scale = 0.5 / columns
+        if title_object.type == 'TEXT':
+            title_object.text = 'Title '+str(index)
+    preset.selected_object = 0
+
+
+def profile_update(addon, title_scene, title_preset, update_all):
+    #runs one update with the update profiler enabled and returns the stage timings and data write counts
+    bpy.context.scene.quicktitler.debug_profiling = True
+    addon.update_profiler.begin(title_scene.name)
+    addon.update_title_scene(title_scene, title_preset, bpy.context.scene.quicktitler, update_all=update_all)
+    addon.update_profiler.end()
+    bpy.context.scene.quicktitler.debug_profiling = False
+    record = addon.update_profiler.records[-1]
+    return {'stages': record['stages'], 'counts': record['counts']}
+
+
+def remove_title(title_scene):
+    for title_object in list(title_scene.objects):
+        bpy.data.objects.remove(title_object)
+    bpy.data.scenes.remove(title_scene)
+
+
+def benchmark_loading(addon, repeat):
+    #times loading every bundled preset into the current scene, presets that fail to load are recorded with their error
+    results = {}
+    preset = bpy.context.scene.quicktitler.current_quicktitle
+    directory = addon.get_presets_directory()
+    for file in sorted(os.listdir(directory)):
+        if file.lower().endswith('.xml'):
+            filepath = os.path.join(directory, file)
+            try:
+                results[file], result = timed(lambda: addon.load_quicktitle(filepath, preset), repeat)
+            except Exception as e:
+                print('Unable to load preset '+file+': '+str(e))
+                results[file] = {'error': str(e)}
+    return results
+
+
+def benchmark_size(addon, size, repeat, directory):
+    #times each stage of working with a synthetic title with the given number of objects
+    results = {}
+    preset = bpy.context.scene.quicktitler.current_quicktitle
+    build_title(preset, size)
+
+    results['create'], title_scene = timed(lambda: addon.create_title_scene(preset))
+    title_preset = title_scene.quicktitler.current_quicktitle
+    results['update_first'], result = timed(lambda: addon.update_title_scene(title_scene, title_preset, bpy.context.scene.quicktitler, update_all=True))
+    results['update_all'], result = timed(lambda: addon.update_title_scene(title_scene, title_preset, bpy.context.scene.quicktitler, update_all=True), repeat)
+    results['update_single'], result = timed(lambda: addon.update_title_scene(title_scene, title_preset, bpy.context.scene.quicktitler), repeat)
+    results['update_all_profile'] = profile_update(addon, title_scene, title_preset, True)
+    results['update_single_profile'] = profile_update(addon, title_scene, title_preset, False)
+
+    filepath = os.path.join(directory, 'benchmark_'+str(size)+'.xml')
+    results['export'], result = timed(lambda: bpy.ops.quicktitler.preset_export(filepath=filepath), repeat)
+
+    #pick at the same random points twice, the first pass has to build the cached geometry
+    random.seed(size)
+    points = [(random.uniform(-1, 1), random.uniform(-0.6, 0.6)) for index in range(50)]
+    pick_all = lambda: [addon.object_at_location(title_scene, x, y) for x, y in points]
+    results['object_at_location_cold'], result = timed(pick_all)
+    results['object_at_location'], result = timed(pick_all, repeat)
+
+    camera_x = bpy.context.scene.render.resolution_x
+    camera_y = bpy.context.scene.render.resolution_y
+    pairs = [(title_scene.objects[object_preset.internal_name], object_preset) for object_preset in title_preset.objects if object_preset.internal_name in title_scene.objects]
+    bounds_all = lambda: [addon.camera_view_bounds_2d(title_scene, title_scene.camera, title_object, object_preset, camera_x, camera_y, 1, 1) for title_object, object_preset in pairs]
+    results['camera_view_bounds_2d'], result = timed(bounds_all, repeat)
+
+    remove_title(title_scene)
+    return results
+
+
+def main():
+    if '--' in sys.argv:
+        arguments = sys.argv[sys.argv.index('--') + 1:]
+    else:
+        arguments = []
+    parser = argparse.ArgumentParser(prog='benchmark.py')
+    parser.add_argument('--output', default='')
+    parser.add_argument('--sizes', default=','.join(str(size) for size in sizes_default))
+    parser.add_argument('--repeat', type=int, default=3)
+    options = parser.parse_args(arguments)
+
+    addon = load_addon()
+    bpy.context.scene.quicktitler.autoupdate = False
+    results = {
+        'blender': bpy.app.version_string,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'repeat': options.repeat,
+        'load_quicktitle': benchmark_loading(addon, options.repeat),
+        'sizes': {}
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        for size in [int(size) for size in options.sizes.split(',') if size.strip()]:
+            print('Benchmarking title with '+str(size)+' objects')
+            results['sizes'][str(size)] = benchmark_size(addon, size, options.repeat, directory)
+
+    output = json.dumps(results, indent=2)
+    print(output)
+    if options.output:
+        with open(options.output, 'w') as output_file:
+            output_file.write(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#Headless regression tests for QuickTitling, run with:
+#  blender -b --factory-startup --python tests.py
+#Blender exits with an error code if any test fails.
+
+import bpy
+import os
+import sys
+import unittest
+import importlib.util
+
+
+def load_addon():
+    #imports the addon from the folder this script is in and registers it
+    directory = os.path.dirname(os.path.realpath(__file__))
+    spec = importlib.util.spec_from_file_location('QuickTitling', os.path.join(directory, '__init__.py'), submodule_search_locations=[directory])
+    addon = importlib.util.module_from_spec(spec)
+    sys.modules['QuickTitling'] = addon
+    spec.loader.exec_module(addon)
+    addon.register()
+    return addon
+
+
+addon = None
+
+
+class GlyphTitleTest(unittest.TestCase):
+    def setUp(self):
+        bpy.context.scene.quicktitler.autoupdate = False
+        addon.glyph_meshes.clear()
+        addon.glyph_advances.clear()
+        addon.glyph_line_heights.clear()
+        self.title_scene = None
+
+    def tearDown(self):
+        if self.title_scene:
+            for title_object in list(self.title_scene.objects):
+                bpy.data.objects.remove(title_object)
+            bpy.data.scenes.remove(self.title_scene)
+
+    def create_glyph_title(self, glyph_mode, text):
+        #creates a title from scratch with a single text object animated by character or word
+        preset = bpy.context.scene.quicktitler.current_quicktitle
+        preset.objects.clear()
+        preset.name = 'Glyph Test'
+        title_object = preset.objects.add()
+        title_object.type = 'TEXT'
+        title_object.name = 'Text'
+        title_object.text = text
+        title_object.glyph_mode = glyph_mode
+        title_object.glyph_stagger = 2
+        for variable in ['Alpha', 'Y Slide']:
+            animation = title_object.animations.add()
+            animation.variable = variable
+            animation.animate_in = True
+            animation.animate_out = True
+        preset.selected_object = 0
+        self.title_scene = addon.create_title_scene(preset)
+        title_preset = self.title_scene.quicktitler.current_quicktitle
+        addon.update_title_scene(self.title_scene, title_preset, bpy.context.scene.quicktitler, update_all=True)
+        return self.title_scene.objects[title_preset.objects[0].internal_name]
+
+    def check_glyphs(self, title_object, text):
+        glyphs = addon.get_glyphs(title_object)
+        self.assertEqual(len(glyphs), len(text.replace(' ', '')))
+        action = bpy.data.actions[title_object.name+' Glyphs']
+        fcurves = addon.get_action_fcurves(action)
+        data_paths = set(fcurve.data_path for fcurve in fcurves)
+        self.assertEqual(data_paths, {'["quicktitle_alpha"]', 'delta_location'})
+        for glyph in glyphs:
+            strip = glyph.animation_data.nla_tracks[0].strips[0]
+            self.assertEqual(strip.action, action)
+            self.assertEqual(strip.action_slot, action.slots[0])
+        return glyphs
+
+    def test_character_glyphs(self):
+        text = 'Hello World'
+        title_object = self.create_glyph_title('CHARACTER', text)
+        glyphs = self.check_glyphs(title_object, text)
+        units = sorted(glyph['quicktitle_glyph_unit'] for glyph in glyphs)
+        self.assertEqual(units, list(range(len(glyphs))))
+
+    def test_word_glyphs(self):
+        text = 'Hello World'
+        title_object = self.create_glyph_title('WORD', text)
+        glyphs = self.check_glyphs(title_object, text)
+        units = set(glyph['quicktitle_glyph_unit'] for glyph in glyphs)
+        self.assertEqual(units, {0, 1})
+
+
+def main():
+    global addon
+    addon = load_addon()
+    suite = unittest.defaultTestLoader.loadTestsFromModule(sys.modules[__name__])
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    if not result.wasSuccessful():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()